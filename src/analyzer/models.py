@@ -1,5 +1,6 @@
 """Data models for the analyzer module."""
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
@@ -34,6 +35,12 @@ class FeatureType(str, Enum):
 
 # ── AOB signature ─────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1024)
+def _split_pattern(pattern: str) -> tuple[str, ...]:
+    """Tokenize an AOB pattern; each distinct pattern string is split once."""
+    return tuple(pattern.split())
+
+
 @dataclass
 class AOBSignature:
     """
@@ -56,22 +63,21 @@ class AOBSignature:
 
     def tokens(self) -> list[str]:
         """Return individual byte tokens (e.g. ['89', '87', '??'])."""
-        return self.pattern.split()
+        return list(_split_pattern(self.pattern))
 
     def is_valid(self) -> bool:
         """Check that every token is a valid 2-hex-digit byte or wildcard."""
-        toks = self.tokens()
+        toks = _split_pattern(self.pattern)
         if not toks:
             return False
         return all(self._BYTE_RE.match(t) for t in toks)
 
     def wildcard_ratio(self) -> float:
         """Fraction of wildcard bytes (0.0 – 1.0).  High ratio = less reliable."""
-        toks = self.tokens()
+        toks = _split_pattern(self.pattern)
         if not toks:
             return 0.0
-        wildcards = sum(1 for t in toks if t == "??")
-        return wildcards / len(toks)
+        return toks.count("??") / len(toks)
 
     def __str__(self) -> str:
         mod = f" [{self.module}]" if self.module else ""
@@ -187,6 +187,19 @@ Target: implement the user-described feature using available structure data.""",
 }
 
 
+# Full system prompt per engine, assembled once at import time
+_SYSTEM_PROMPTS: dict[str, str] = {
+    engine: "\n\n".join([
+        "You are an expert Cheat Engine (CE) Lua script writer for "
+        "single-player PC games.",
+        addendum.strip(),
+        _SHARED_RULES.strip(),
+        _OUTPUT_CONTRACT.strip(),
+    ])
+    for engine, addendum in _ENGINE_ADDENDUM.items()
+}
+
+
 # ── PromptBuilder ─────────────────────────────────────────────────────────────
 
 class PromptBuilder:
@@ -203,15 +216,7 @@ class PromptBuilder:
 
     def system_prompt(self, engine_type: Optional[str] = None) -> str:
         """Return the system prompt for the given engine type."""
-        addendum = _ENGINE_ADDENDUM.get(engine_type or "Unknown",
-                                        _ENGINE_ADDENDUM["Unknown"])
-        return "\n\n".join([
-            "You are an expert Cheat Engine (CE) Lua script writer for "
-            "single-player PC games.",
-            addendum.strip(),
-            _SHARED_RULES.strip(),
-            _OUTPUT_CONTRACT.strip(),
-        ])
+        return _SYSTEM_PROMPTS.get(engine_type or "Unknown", _SYSTEM_PROMPTS["Unknown"])
 
     def build(
         self,
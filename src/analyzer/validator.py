@@ -62,6 +62,9 @@ _MONO_API_PATTERNS = re.compile(
 _TOGGLE_PATTERNS = re.compile(
     r"\b(cheatEnabled|enabled|isActive|toggle)\b", re.IGNORECASE
 )
+_AOBSCAN_CALL_RE = re.compile(r"\bAOBScan\b")
+# Temp-file path prefixing luac error messages
+_LUAC_TMP_PATH_RE = re.compile(r"^[^\s]+\.lua:")
 
 # Resolution strategies that do NOT require per-field AOB
 _NO_AOB_STRATEGIES = {"mono_api"}
@@ -208,7 +211,7 @@ class ScriptValidator:
         # 8. Mono-specific: warn if AOBScan used heavily (defeats the purpose)
         if strategy == "mono_api":
             checks.append("mono_no_excessive_aob")
-            aob_calls = len(re.findall(r"\bAOBScan\b", code))
+            aob_calls = len(_AOBSCAN_CALL_RE.findall(code))
             if aob_calls > 2:
                 warnings.append(
                     f"Mono script calls AOBScan {aob_calls} times. "
@@ -241,7 +244,7 @@ class ScriptValidator:
 
             if result.returncode != 0:
                 msg = result.stderr.strip()
-                msg = re.sub(r"^[^\s]+\.lua:", "<script>:", msg)
+                msg = _LUAC_TMP_PATH_RE.sub("<script>:", msg)
                 return msg
         except (OSError, subprocess.TimeoutExpired) as exc:
             logger.warning("luac check failed: %s", exc)
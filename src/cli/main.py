@@ -261,7 +261,7 @@ def cmd_generate(
     aob_json = _json.dumps([
         {"pattern": s.pattern, "offset": s.offset, "module": s.module}
         for s in script.aob_sigs
-    ]) if script.aob_sigs else None
+    ]) if script.aob_sigs else "[]"
     record = ScriptRecord(
         game_hash=game_hash,
         game_name=game_name,
@@ -114,7 +114,8 @@ class IL2CPPDumper(AbstractDumper):
             metadata,
             str(output_dir),
         ]
-        logger.debug("Running: %s", " ".join(cmd))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Running: %s", " ".join(cmd))
         try:
             result = subprocess.run(
                 cmd,
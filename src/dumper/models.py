@@ -1,7 +1,8 @@
 """Data models for the dumper module — the canonical StructureJSON format."""
 
-from dataclasses import dataclass, field
+import functools
 import json
+from dataclasses import dataclass, field
 
 __all__ = ["FieldInfo", "ClassInfo", "StructureJSON"]
 
@@ -9,6 +10,17 @@ __all__ = ["FieldInfo", "ClassInfo", "StructureJSON"]
 _DEFAULT_MAX_CLASSES = 60
 
 
+@functools.cache
+def _parse_offset(offset: str) -> int | None:
+    """Parse a hex offset ("0x58" or "58"); None if empty or malformed."""
+    if not offset:
+        return None
+    try:
+        return int(offset, 16)
+    except (ValueError, TypeError):
+        return None
+
+
 @dataclass
 class FieldInfo:
     name:      str
@@ -16,12 +28,27 @@ class FieldInfo:
     offset:    str     # hex string e.g. "0x58", or "" if unknown
     is_static: bool = False
 
+    @property
+    def offset_int(self) -> int | None:
+        """:attr:`offset` as an int (None if unknown); each distinct string is parsed once."""
+        return _parse_offset(self.offset)
+
     def to_dict(self) -> dict:
         d = {"name": self.name, "type": self.type, "offset": self.offset}
         if self.is_static:
             d["static"] = True
         return d
 
+    @classmethod
+    def from_dict(cls, d: dict) -> "FieldInfo":
+        """Inverse of :meth:`to_dict`."""
+        return cls(
+            name=d["name"],
+            type=d["type"],
+            offset=d.get("offset", ""),
+            is_static=bool(d.get("static", False)),
+        )
+
 
 @dataclass
 class ClassInfo:
@@ -37,6 +64,16 @@ class ClassInfo:
         d["fields"] = [f.to_dict() for f in self.fields]
         return d
 
+    @classmethod
+    def from_dict(cls, d: dict) -> "ClassInfo":
+        """Inverse of :meth:`to_dict`."""
+        return cls(
+            name=d["name"],
+            namespace=d.get("namespace", ""),
+            fields=[FieldInfo.from_dict(f) for f in d.get("fields", ())],
+            parent_class=d.get("parent"),
+        )
+
 
 @dataclass
 class StructureJSON:
@@ -61,6 +98,19 @@ class StructureJSON:
     def to_json(self, indent: int = 2) -> str:
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
 
+    @classmethod
+    def from_dict(cls, d: dict) -> "StructureJSON":
+        """Inverse of :meth:`to_dict` (``raw_dump_path`` is not serialised)."""
+        return cls(
+            engine=d["engine"],
+            version=d["version"],
+            classes=[ClassInfo.from_dict(c) for c in d.get("classes", ())],
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "StructureJSON":
+        return cls.from_dict(json.loads(text))
+
     def to_prompt_str(self, max_classes: int = _DEFAULT_MAX_CLASSES) -> str:
         """
         Produce a compact, token-efficient string for LLM Prompt injection.
@@ -40,10 +40,18 @@ _UE4SS_MARKERS = [
 _DUMP_POLL_INTERVAL = 0.5   # seconds between existence checks
 _DUMP_TIMEOUT = 60.0        # total seconds to wait for ObjectDump.txt
 
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x1  # wake on create / rename / delete in directory
+_WAIT_OBJECT_0 = 0x0
+_WAIT_TIMEOUT  = 0x102
+
 _VK_F10     = 0x79   # Virtual key code for F10
 _WM_KEYDOWN = 0x100  # WM_KEYDOWN message
 _WM_KEYUP   = 0x101  # WM_KEYUP message
 
+_SMTO_ABORTIFHUNG = 0x0002  # return immediately if the target window is hung
+_SEND_TIMEOUT_MS  = 500     # per-message delivery timeout
+_ERROR_TIMEOUT    = 1460    # GetLastError() when SendMessageTimeoutW times out
+
 # ObjectDump.txt line patterns (UE4SS format)
 _CLASS_LINE_RE = re.compile(r"^Class\s+([\w:./]+)")
 _PROP_LINE_RE  = re.compile(
@@ -137,23 +145,59 @@ class UnrealDumper(AbstractDumper):
 
         dump_file = game_dir / "ObjectDump.txt"
         logger.info("Waiting for ObjectDump.txt (up to %ds)...", int(_DUMP_TIMEOUT))
-        deadline = time.monotonic() + _DUMP_TIMEOUT
-        while time.monotonic() < deadline:
-            if dump_file.exists():
-                elapsed = _DUMP_TIMEOUT - (deadline - time.monotonic())
-                logger.info("ObjectDump.txt appeared after %.1fs", elapsed)
-                return
-            time.sleep(_DUMP_POLL_INTERVAL)
+        started = time.monotonic()
+        if self._wait_for_file(dump_file, _DUMP_TIMEOUT):
+            logger.info("ObjectDump.txt appeared after %.1fs", time.monotonic() - started)
+            return
 
         raise DumpTimeoutError(
             f"ObjectDump.txt did not appear within {_DUMP_TIMEOUT:.0f}s. "
             "Make sure UE4SS is loaded (check UE4SS.log) and try pressing F10 manually."
         )
 
+    @staticmethod
+    def _wait_for_file(path: Path, timeout: float) -> bool:
+        """
+        Block until *path* exists or *timeout* seconds elapse.
+
+        On Windows the thread sleeps kernel-side on a directory change
+        notification (FindFirstChangeNotificationW) and only wakes when a
+        file is created or renamed in the parent directory.  Elsewhere, or
+        if the notification handle cannot be opened, falls back to polling
+        every _DUMP_POLL_INTERVAL seconds.
+
+        Returns True if the file appeared, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        watcher = _open_change_notification(path.parent) if _IS_WINDOWS else None
+
+        if watcher is not None:
+            kernel32, handle = watcher
+            try:
+                while True:
+                    # Check before waiting: the file may predate the notification handle
+                    if path.exists():
+                        return True
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    rc = kernel32.WaitForSingleObject(handle, int(remaining * 1000))
+                    if rc not in (_WAIT_OBJECT_0, _WAIT_TIMEOUT):
+                        break  # WAIT_FAILED → fall back to polling
+                    kernel32.FindNextChangeNotification(handle)
+            finally:
+                kernel32.FindCloseChangeNotification(handle)
+
+        while time.monotonic() < deadline:
+            if path.exists():
+                return True
+            time.sleep(_DUMP_POLL_INTERVAL)
+        return path.exists()
+
     def _send_f10_to_game_window(self, exe_base_name: str) -> bool:
         """
         Find the first top-level window whose title contains *exe_base_name*
-        and post WM_KEYDOWN + WM_KEYUP for VK_F10.
+        and send WM_KEYDOWN + WM_KEYUP for VK_F10 (see _send_key_with_timeout).
 
         Returns True if a matching window was found and key was sent.
         Returns False if no matching window was found.
@@ -181,15 +225,15 @@ class UnrealDumper(AbstractDumper):
         target = exe_base_name.lower()
         for hwnd, title in windows_found:
             if target in title.lower():
-                ctypes.windll.user32.PostMessageW(hwnd, _WM_KEYDOWN, _VK_F10, 0)
-                ctypes.windll.user32.PostMessageW(hwnd, _WM_KEYUP,   _VK_F10, 0)
+                _send_key_with_timeout(hwnd, _VK_F10)
                 logger.debug("Sent F10 to window '%s' (hwnd=0x%X)", title, hwnd)
                 return True
 
-        logger.debug(
-            "No window found matching '%s' among %d windows",
-            exe_base_name, len(windows_found),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "No window found matching '%s' among %d windows",
+                exe_base_name, len(windows_found),
+            )
         return False
 
     # ── Parser ────────────────────────────────────────────────────────────────
@@ -241,3 +285,73 @@ class UnrealDumper(AbstractDumper):
         except (OSError, json.JSONDecodeError) as exc:
             logger.warning("Failed to load ue_offsets_table.json: %s", exc)
         return {}
+
+
+def _send_key_with_timeout(hwnd: int, vk: int) -> None:
+    """
+    Deliver WM_KEYDOWN + WM_KEYUP for *vk* to *hwnd*.
+
+    Uses SendMessageTimeoutW with SMTO_ABORTIFHUNG so a hung window fails
+    fast instead of silently swallowing the key and leaving us to time out
+    on the dump poll.  If delivery fails, the message is re-queued with
+    PostMessageW — UE4SS may still pick it up once the window recovers.
+    """
+    import ctypes
+    import ctypes.wintypes as wt
+
+    # Private WinDLL with use_last_error: ctypes saves GetLastError as the
+    # call returns, so no intervening ctypes call can overwrite it
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    send = user32.SendMessageTimeoutW
+    send.argtypes = (
+        wt.HWND, wt.UINT, wt.WPARAM, wt.LPARAM, wt.UINT, wt.UINT,
+        ctypes.POINTER(ctypes.c_size_t),   # PDWORD_PTR
+    )
+    send.restype = wt.LPARAM               # LRESULT
+
+    result = ctypes.c_size_t()
+    for msg in (_WM_KEYDOWN, _WM_KEYUP):
+        if send(hwnd, msg, vk, 0, _SMTO_ABORTIFHUNG, _SEND_TIMEOUT_MS, ctypes.byref(result)):
+            continue
+        err = ctypes.get_last_error()
+        if err == _ERROR_TIMEOUT:
+            logger.warning(
+                "Game window (hwnd=0x%X) did not respond within %d ms; "
+                "queueing key message instead", hwnd, _SEND_TIMEOUT_MS,
+            )
+        else:
+            logger.warning("SendMessageTimeoutW failed (error %d); queueing key message", err)
+        user32.PostMessageW(hwnd, msg, vk, 0)
+
+
+def _open_change_notification(directory: Path):
+    """
+    Open a Win32 change-notification handle on *directory*.
+
+    Returns ``(kernel32, handle)`` or None if the API is unavailable or the
+    call fails — callers then fall back to polling.
+    """
+    try:
+        import ctypes
+        import ctypes.wintypes as wt
+        # Private instance: the prototypes below leave ctypes.windll.kernel32 alone
+        kernel32 = ctypes.WinDLL("kernel32")
+    except (ImportError, AttributeError, OSError):
+        return None
+
+    # Declare HANDLE arguments/results so 64-bit handles are not truncated to int
+    kernel32.FindFirstChangeNotificationW.argtypes = (wt.LPCWSTR, wt.BOOL, wt.DWORD)
+    kernel32.FindFirstChangeNotificationW.restype = wt.HANDLE
+    kernel32.WaitForSingleObject.argtypes = (wt.HANDLE, wt.DWORD)
+    kernel32.WaitForSingleObject.restype = wt.DWORD
+    kernel32.FindNextChangeNotification.argtypes = (wt.HANDLE,)
+    kernel32.FindNextChangeNotification.restype = wt.BOOL
+    kernel32.FindCloseChangeNotification.argtypes = (wt.HANDLE,)
+    kernel32.FindCloseChangeNotification.restype = wt.BOOL
+    handle = kernel32.FindFirstChangeNotificationW(
+        str(directory), False, _FILE_NOTIFY_CHANGE_FILE_NAME
+    )
+    if not handle or handle == ctypes.c_void_p(-1).value:  # INVALID_HANDLE_VALUE
+        logger.debug("FindFirstChangeNotificationW failed for %s, polling instead", directory)
+        return None
+    return kernel32, handle
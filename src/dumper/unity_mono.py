@@ -19,13 +19,23 @@ NOTE: The actual Mono API calls require Windows + pymem.
       unit-tested independently via mocking.
 """
 
+import array
+import functools
+import hashlib
 import logging
+import os
 import platform
 import re
+import struct
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from src.detector.models import EngineInfo, EngineType
 from src.exceptions import DumperError
+
 from .base import AbstractDumper
 from .models import ClassInfo, FieldInfo, StructureJSON
 
@@ -34,6 +44,7 @@ __all__ = ["UnityMonoDumper"]
 logger = logging.getLogger(__name__)
 
 _IS_WINDOWS = platform.system() == "Windows"
+_BIG_ENDIAN_HOST = sys.byteorder == "big"
 
 # ── MonoDomain struct offsets (Unity MonoBleedingEdge 5.x, 64-bit) ────────────
 # These match Unity 2019.4+ through 2022.x for most games.
@@ -46,6 +57,37 @@ _IMAGE_N_ROWS_OFFSET = 0x18        # MonoImage typedef row count (uint32)
 _IMAGE_NAMES_OFFSET = 0x20         # MonoImage typedef name ptrs (char*[])
 _IMAGE_NS_OFFSET = 0x28          # MonoImage typedef namespace ptrs (char*[])
 _MAX_ASSEMBLIES = 512              # safety cap to prevent infinite loops
+_ASSEMBLY_WORKERS = 8              # concurrent per-assembly class-table readers
+
+# MOV RAX, [RIP + disp32] opcode prefix (followed by the 4-byte displacement)
+_MOV_RAX_RIP = b"\x48\x8B\x05"
+# mono_domain_get scan windows: read the prologue first, the full window on a miss
+_DOMAIN_GET_SCAN_WINDOWS = (16, 64)
+
+# Persistent dump cache: one JSON file per (exe, mono dll) build
+_DUMP_CACHE_DIR = Path.home() / ".cache" / "ai-trainer-gen" / "dumps"
+
+# (mono_dll_path, mtime_ns) → {export name: RVA}; survives across dumps
+_EXPORT_CACHE: dict[tuple[str, int], dict[str, int]] = {}
+
+# Precompiled scalar layouts (format parsed once, not per read)
+_U64 = struct.Struct("<Q")
+_I32 = struct.Struct("<i")
+
+# GList node = adjacent data + next pointers, fetched in one 16-byte read
+_GLIST_NODE = struct.Struct("<QQ")
+# MonoImage + 0x10: assembly_name, n_rows (+4 pad), names[], namespaces[]
+_IMAGE_HEADER = struct.Struct("<QIxxxxQQ")
+
+# Page cache for small pointer reads (one dump's working set)
+_PAGE_SIZE = 0x1000
+_PAGE_MASK = _PAGE_SIZE - 1
+_PAGE_CACHE_PAGES = 128         # 512 KiB per dump
+
+# C-string coalescing: pointers closer than this share one span read
+_CSTRING_MAX_LEN = 256
+_CSTRING_CLUSTER_GAP = 0x1000      # one page
+_CSTRING_SPAN_MAX = 0x10_0000      # cap a single coalesced read at 1 MiB
 
 
 class UnityMonoDumper(AbstractDumper):
@@ -71,17 +113,30 @@ class UnityMonoDumper(AbstractDumper):
                 "Re-run GameEngineDetector with the game running."
             )
 
+        # A game build's layout never changes: a disk-cache hit skips memory reads entirely
+        cache_path = _dump_cache_path(engine_info.exe_path, mono_dll)
+        cached = _load_cached_dump(cache_path) if cache_path else None
+        if cached is not None:
+            logger.info(
+                "UnityMono: loaded %d classes from dump cache %s",
+                len(cached.classes), cache_path,
+            )
+            return cached
+
         exe_name = Path(engine_info.exe_path).name
         reader = _MonoReader(exe_name, mono_dll)
         classes = reader.read_all_classes()
 
         logger.info("UnityMono: dumped %d classes from %s", len(classes), exe_name)
 
-        return StructureJSON(
+        structure = StructureJSON(
             engine=str(engine_info.type),
             version=engine_info.version,
             classes=classes,
         )
+        if cache_path and classes:
+            _store_cached_dump(cache_path, structure)
+        return structure
 
 
 class _MonoReader:
@@ -113,8 +168,12 @@ class _MonoReader:
         self._process_name = process_name
         self._mono_dll_path = mono_dll_path
         self._pm = None          # pymem.Pymem instance
+        self._nt_read = None     # direct NtReadVirtualMemory reader (Windows)
         self._mono_base = 0      # base address of mono*.dll in target
         self._exports: dict = {} # name → VA
+        # page base → 4 KiB page contents, LRU order (oldest first)
+        self._page_cache: OrderedDict[int, bytes] = OrderedDict()
+        self._page_lock = threading.Lock()
 
     def read_all_classes(self) -> list[ClassInfo]:
         """
@@ -124,31 +183,33 @@ class _MonoReader:
         self._attach()
         self._resolve_mono_base()
         self._resolve_exports()
+        self._page_cache.clear()
         return self._walk_assemblies()
 
     # ── Attachment ────────────────────────────────────────────────────────────
 
     def _attach(self) -> None:
+        pymem = _load_pymem()
         try:
-            import pymem
             self._pm = pymem.Pymem(self._process_name)
             logger.debug("Attached to process: %s (PID %d)",
                          self._process_name, self._pm.process_id)
-        except ImportError as exc:
-            raise DumperError(
-                "pymem is not installed. Run: pip install pymem"
-            ) from exc
         except Exception as exc:
             raise DumperError(
                 f"Cannot attach to '{self._process_name}': {exc}\n"
                 "Make sure the game is running."
             ) from exc
 
+        if _IS_WINDOWS:
+            try:
+                self._nt_read = _NtVirtualMemoryReader(self._pm.process_handle).read_bytes
+            except (OSError, AttributeError) as exc:
+                logger.debug("NtReadVirtualMemory unavailable, using pymem: %s", exc)
+
     def _resolve_mono_base(self) -> None:
         """Find the loaded base address of the mono DLL in the target process."""
-        import pymem.process
         mono_name = Path(self._mono_dll_path).name.lower()
-        module = pymem.process.module_from_name(self._pm.process_handle, mono_name)
+        module = _load_pymem().process.module_from_name(self._pm.process_handle, mono_name)
         if module is None:
             raise DumperError(
                 f"Module '{mono_name}' not found in process '{self._process_name}'. "
@@ -158,50 +219,163 @@ class _MonoReader:
         logger.debug("Mono base: 0x%X", self._mono_base)
 
     def _resolve_exports(self) -> None:
-        """Build a name→VA map for required Mono API functions."""
-        import ctypes
-        import ctypes.wintypes as wt
-        # GetProcAddress on the remote DLL — load it locally to resolve exports
-        hmod = ctypes.windll.kernel32.LoadLibraryExW(
-            self._mono_dll_path, None, 0x00000001  # DONT_RESOLVE_DLL_REFERENCES
-        )
-        if not hmod:
-            raise DumperError(f"LoadLibraryEx failed for {self._mono_dll_path}")
+        """
+        Build a name→VA map for required Mono API functions.
 
-        base_local  = hmod
-        base_remote = self._mono_base
+        Export offsets (RVAs) depend only on the DLL file, so they are cached
+        module-wide per ``(path, mtime)``; only the rebase onto the remote
+        module base is repeated for each dump.
+        """
+        try:
+            key = (self._mono_dll_path, os.stat(self._mono_dll_path).st_mtime_ns)
+        except OSError:
+            key = None
+
+        rvas = _EXPORT_CACHE.get(key) if key else None
+        if rvas is None:
+            rvas = _load_export_rvas(self._mono_dll_path, self._MONO_EXPORTS)
+            if key:
+                _EXPORT_CACHE[key] = rvas
+
+        # Convert RVA → remote VA (same offset, different base)
+        self._exports = {name: self._mono_base + rva for name, rva in rvas.items()}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Resolved %d/%d Mono exports", len(self._exports), len(self._MONO_EXPORTS)
+            )
 
-        for name in self._MONO_EXPORTS:
-            local_va = ctypes.windll.kernel32.GetProcAddress(hmod, name.encode())
-            if local_va:
-                # Convert local VA → remote VA (same offset, different base)
-                offset = local_va - base_local
-                self._exports[name] = base_remote + offset
+    # ── Memory read helpers ───────────────────────────────────────────────────
 
-        ctypes.windll.kernel32.FreeLibrary(hmod)
-        logger.debug("Resolved %d/%d Mono exports", len(self._exports), len(self._MONO_EXPORTS))
+    def _reader(self):
+        """
+        Return the low-level ``read(addr, size) -> bytes`` callable.
 
-    # ── Memory read helpers ───────────────────────────────────────────────────
+        Hot loops bind this once to a local instead of going through
+        _read_bytes / _read_ptr (method dispatch + attribute lookups per read).
+        """
+        return self._nt_read or self._pm.read_bytes
+
+    def _read_bytes(self, addr: int, size: int) -> bytes:
+        """Single entry point for remote reads (ntdll fast path, else pymem)."""
+        return self._reader()(addr, size)
+
+    def _read_cached(self, addr: int, size: int) -> bytes:
+        """
+        Serve a small read from the per-dump page cache.
+
+        A miss fetches the whole 4 KiB page containing *addr* (about the
+        same cost as an 8-byte RPM) so neighbouring pointer reads — GList
+        nodes from Mono's slab allocator, adjacent struct fields — hit
+        locally.  A read straddling a page boundary is assembled from both
+        pages.  Reads larger than a page, or whose pages cannot be read in
+        full, go straight to the target.
+        """
+        page = addr & ~_PAGE_MASK
+        off = addr - page
+        end = off + size
+
+        if end <= _PAGE_SIZE:
+            data = self._cached_page(page)
+            if data is None:
+                return self._read_bytes(addr, size)
+            return data[off:end]
+
+        if size > _PAGE_SIZE:
+            return self._read_bytes(addr, size)
+
+        # Page-straddling read: fetch both pages through the cache and stitch them
+        first = self._cached_page(page)
+        second = self._cached_page(page + _PAGE_SIZE) if first is not None else None
+        if second is None:
+            return self._read_bytes(addr, size)
+        return first[off:] + second[:end - _PAGE_SIZE]
+
+    def _cached_page(self, page: int) -> bytes | None:
+        """Return the 4 KiB page at *page* (LRU-cached), or None if unreadable."""
+        cache = self._page_cache
+        # Shared by the parallel assembly readers; the remote read runs outside the lock
+        with self._page_lock:
+            data = cache.get(page)
+            if data is not None:
+                cache.move_to_end(page)
+                return data
+
+        try:
+            data = self._read_bytes(page, _PAGE_SIZE)
+        except Exception:
+            return None
+        with self._page_lock:
+            cache[page] = data
+            if len(cache) > _PAGE_CACHE_PAGES:
+                cache.popitem(last=False)
+        return data
 
     def _read_ptr(self, addr: int) -> int:
         """Read an 8-byte little-endian pointer from the target process."""
-        return int.from_bytes(self._pm.read_bytes(addr, 8), "little")
+        return _U64.unpack_from(self._read_cached(addr, 8))[0]
 
-    def _read_int32(self, addr: int) -> int:
-        """Read a 4-byte little-endian unsigned integer from the target process."""
-        return int.from_bytes(self._pm.read_bytes(addr, 4), "little")
-
-    def _read_cstring(self, addr: int, max_len: int = 256) -> str:
+    def _read_cstring(self, addr: int, max_len: int = _CSTRING_MAX_LEN) -> str:
         """Read a null-terminated UTF-8 string from the target process."""
         if not addr:
             return ""
         try:
-            data = self._pm.read_bytes(addr, max_len)
+            data = self._read_bytes(addr, max_len)
         except Exception:
             return ""
-        null = data.find(b"\x00")
-        raw = data[:null] if null >= 0 else data
-        return raw.decode("utf-8", errors="replace")
+        return _slice_cstring(data, 0, max_len)
+
+    def _read_cstrings(self, ptrs, max_len: int = _CSTRING_MAX_LEN) -> dict[int, str]:
+        """
+        Read many null-terminated strings with as few remote reads as possible.
+
+        Unique pointers are sorted and grouped into clusters whose neighbours
+        lie less than _CSTRING_CLUSTER_GAP apart; each cluster is fetched with
+        one read spanning ``[first, last + max_len)`` and sliced locally.
+        Clusters whose span read fails fall back to per-pointer reads.
+
+        Returns a map ``{ptr: str}`` (always containing ``0 → ""``).
+        """
+        result: dict[int, str] = {0: ""}
+        addrs = sorted({p for p in ptrs if p})
+        read = self._reader()
+        i = 0
+        while i < len(addrs):
+            start = addrs[i]
+            j = i + 1
+            # Pointers less than a page apart join the cluster while its span stays capped
+            while (j < len(addrs)
+                   and addrs[j] - addrs[j - 1] < _CSTRING_CLUSTER_GAP
+                   and addrs[j] + max_len - start <= _CSTRING_SPAN_MAX):
+                j += 1
+            cluster = addrs[i:j]
+            i = j
+
+            if len(cluster) == 1:
+                result[start] = self._read_cstring(start, max_len)
+                continue
+            try:
+                buf = read(start, cluster[-1] + max_len - start)
+            except Exception:
+                for addr in cluster:
+                    result[addr] = self._read_cstring(addr, max_len)
+                continue
+            for addr in cluster:
+                result[addr] = _slice_cstring(buf, addr - start, max_len)
+        return result
+
+    def _read_ptr_tables(self, addrs: list[int], count: int) -> list[list[int]]:
+        """
+        Read several tables of *count* consecutive 8-byte pointers.
+
+        One read per table instead of one per element — the syscall, not the
+        copy, dominates remote reads.
+        NULL table addresses yield all-zero tables.
+        """
+        if count <= 0:
+            return [[] for _ in addrs]
+        read = self._reader()
+        size = count * 8
+        return [_unpack_ptrs(read(addr, size)) if addr else [0] * count for addr in addrs]
 
     # ── Root domain discovery ─────────────────────────────────────────────────
 
@@ -221,11 +395,14 @@ class _MonoReader:
         if fn_va is None:
             raise DumperError("mono_domain_get export not resolved")
 
-        code = self._pm.read_bytes(fn_va, 64)
+        # The MOV is almost always at the function start: read a little, widen on a miss
+        for window in _DOMAIN_GET_SCAN_WINDOWS:
+            code = self._read_bytes(fn_va, window)
 
-        for i in range(len(code) - 7):
-            if code[i:i+3] == b"\x48\x8B\x05":
-                disp = int.from_bytes(code[i+3:i+7], "little", signed=True)
+            # C-level substring search instead of a byte-by-byte Python loop
+            i = code.find(_MOV_RAX_RIP)
+            if 0 <= i and i + 7 <= len(code):
+                disp = _I32.unpack_from(code, i + 3)[0]
                 # RIP = address of next instruction = fn_va + i + 7
                 global_va = fn_va + i + 7 + disp
                 domain_ptr = self._read_ptr(global_va)
@@ -255,25 +432,38 @@ class _MonoReader:
 
         glist_ptr = self._read_ptr(domain + _DOMAIN_ASSEMBLIES_OFFSET)
 
-        classes: list[ClassInfo] = []
+        assembly_ptrs: list[int] = []
         visited: set[int] = set()
         count = 0
 
+        # Local bindings keep attribute lookups out of the hot loop; GList nodes
+        # mostly share a page, so they are read through the page cache
+        read = self._read_cached
+        unpack_node = _GLIST_NODE.unpack_from
+        node_size = _GLIST_NODE.size
+
+        # Walk the GList serially to collect assembly pointers (cheap); the class
+        # tables are then read in parallel
         while glist_ptr and glist_ptr not in visited and count < _MAX_ASSEMBLIES:
             visited.add(glist_ptr)
             count += 1
 
-            assembly_ptr = self._read_ptr(glist_ptr + _GLIST_DATA_OFFSET)
-            glist_ptr    = self._read_ptr(glist_ptr + _GLIST_NEXT_OFFSET)
+            # data and next are adjacent: one remote read
+            assembly_ptr, glist_ptr = unpack_node(read(glist_ptr + _GLIST_DATA_OFFSET, node_size))
 
-            if not assembly_ptr:
-                continue
+            if assembly_ptr:
+                assembly_ptrs.append(assembly_ptr)
 
-            try:
-                assembly_classes = self._read_assembly_classes(assembly_ptr)
-                classes.extend(assembly_classes)
-            except Exception as exc:
-                logger.warning("Skipping assembly @ 0x%X: %s", assembly_ptr, exc)
+        # Assemblies are independent and memory-read syscalls release the GIL, so a
+        # thread pool really overlaps the remote reads; map keeps assembly order
+        workers = min(_ASSEMBLY_WORKERS, len(assembly_ptrs))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                per_assembly = list(pool.map(self._read_assembly_classes_safe, assembly_ptrs))
+        else:
+            per_assembly = [self._read_assembly_classes_safe(p) for p in assembly_ptrs]
+
+        classes = [c for assembly_classes in per_assembly for c in assembly_classes]
 
         logger.info(
             "UnityMono: walked %d assemblies, collected %d classes",
@@ -281,6 +471,14 @@ class _MonoReader:
         )
         return classes
 
+    def _read_assembly_classes_safe(self, assembly_ptr: int) -> list[ClassInfo]:
+        """_read_assembly_classes, logging and skipping unreadable assemblies."""
+        try:
+            return self._read_assembly_classes(assembly_ptr)
+        except Exception as exc:
+            logger.warning("Skipping assembly @ 0x%X: %s", assembly_ptr, exc)
+            return []
+
     def _read_assembly_classes(self, assembly_ptr: int) -> list[ClassInfo]:
         """
         Read class names from a MonoAssembly by reading its MonoImage tables.
@@ -296,33 +494,170 @@ class _MonoReader:
         if not image_ptr:
             return []
 
-        img_name_ptr = self._read_ptr(image_ptr + _IMAGE_NAME_OFFSET)
-        img_name = self._read_cstring(img_name_ptr)
-        if not img_name:
-            img_name = "?"
-
-        n_rows = self._read_int32(image_ptr + _IMAGE_N_ROWS_OFFSET)
+        # Fields at 0x10..0x30 in one read (4 bytes of padding beat 4 RPM calls)
+        img_name_ptr, n_rows, names_ptr, ns_ptr = _IMAGE_HEADER.unpack_from(
+            self._read_bytes(image_ptr + _IMAGE_NAME_OFFSET, _IMAGE_HEADER.size)
+        )
         if n_rows <= 0 or n_rows > 50_000:
             return []
 
-        names_ptr  = self._read_ptr(image_ptr + _IMAGE_NAMES_OFFSET)
-        ns_ptr     = self._read_ptr(image_ptr + _IMAGE_NS_OFFSET)
+        # Each pointer table in one read, parsed locally (not one RPM per row)
+        name_ptrs, ns_ptrs = self._read_ptr_tables([names_ptr, ns_ptr], n_rows)
 
-        classes: list[ClassInfo] = []
-        for i in range(n_rows):
-            try:
-                name_entry   = names_ptr + i * 8
-                ns_entry     = ns_ptr   + i * 8
-                name_str_ptr = self._read_ptr(name_entry) if names_ptr else 0
-                ns_str_ptr   = self._read_ptr(ns_entry)   if ns_ptr   else 0
-                name = self._read_cstring(name_str_ptr)
-                ns   = self._read_cstring(ns_str_ptr)
-                if name:
-                    classes.append(ClassInfo(name=name, namespace=ns))
-            except Exception:
-                continue
+        # Drop NULL-name rows first; their namespace strings need no read
+        rows = [(n, ns) for n, ns in zip(name_ptrs, ns_ptrs, strict=True) if n]
 
-        logger.debug(
-            "Assembly %s: %d classes", img_name, len(classes)
-        )
+        # Dedupe and cluster all name/namespace strings by address and batch the
+        # reads (a shared namespace pointer is read once)
+        strings = self._read_cstrings([p for row in rows for p in row])
+
+        classes = [
+            ClassInfo(name=strings[name_str_ptr], namespace=strings[ns_str_ptr])
+            for name_str_ptr, ns_str_ptr in rows
+            if strings[name_str_ptr]
+        ]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # The assembly name only feeds the debug log, so read it on demand
+            img_name = self._read_cstring(img_name_ptr) or "?"
+            logger.debug("Assembly %s: %d classes", img_name, len(classes))
         return classes
+
+
+def _dump_cache_path(exe_path: str, mono_dll_path: str) -> Path | None:
+    """
+    Cache file for a dump of this exact game build, or None if unkeyable.
+
+    The key hashes both paths with their mtimes, so patching either the
+    game executable or the Mono runtime invalidates the cached dump.
+    """
+    try:
+        exe_mtime = os.stat(exe_path).st_mtime_ns
+        dll_mtime = os.stat(mono_dll_path).st_mtime_ns
+    except OSError:
+        return None
+    material = f"{exe_path}\0{exe_mtime}\0{mono_dll_path}\0{dll_mtime}".encode()
+    key = hashlib.blake2b(material, digest_size=16).hexdigest()
+    return _DUMP_CACHE_DIR / f"{key}.json"
+
+
+def _load_cached_dump(path: Path) -> StructureJSON | None:
+    """Read a cached dump; a missing or corrupt file is a cache miss."""
+    try:
+        return StructureJSON.from_json(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        logger.debug("Ignoring unreadable dump cache %s: %s", path, exc)
+        return None
+
+
+def _store_cached_dump(path: Path, structure: StructureJSON) -> None:
+    """Write *structure* to the dump cache atomically; failures are non-fatal."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(structure.to_json(indent=None), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as exc:
+        logger.warning("Could not write dump cache %s: %s", path, exc)
+        tmp.unlink(missing_ok=True)
+
+
+@functools.cache
+def _load_pymem():
+    """
+    Import pymem (and its ``process`` submodule) once per interpreter.
+
+    Deferred until the first attach so importing src.dumper stays cheap on
+    machines without pymem; later dumps reuse the cached module object.
+    """
+    try:
+        import pymem
+        import pymem.process  # noqa: F401  — binds pymem.process
+    except ImportError as exc:
+        raise DumperError("pymem is not installed. Run: pip install pymem") from exc
+    return pymem
+
+
+def _load_export_rvas(dll_path: str, names: list[str]) -> dict[str, int]:
+    """
+    Resolve export RVAs by mapping *dll_path* locally (without running its
+    DllMain or resolving its imports) and querying GetProcAddress.
+    """
+    import ctypes
+    kernel32 = ctypes.windll.kernel32
+    hmod = kernel32.LoadLibraryExW(dll_path, None, 0x00000001)  # DONT_RESOLVE_DLL_REFERENCES
+    if not hmod:
+        raise DumperError(f"LoadLibraryEx failed for {dll_path}")
+    try:
+        rvas: dict[str, int] = {}
+        for name in names:
+            local_va = kernel32.GetProcAddress(hmod, name.encode())
+            if local_va:
+                rvas[name] = local_va - hmod
+        return rvas
+    finally:
+        kernel32.FreeLibrary(hmod)
+
+
+class _NtVirtualMemoryReader:
+    """
+    Direct ``ntdll!NtReadVirtualMemory`` binding.
+
+    Bypasses pymem's per-call Python wrapper (argument boxing, a fresh
+    ctypes buffer per read).  Small reads land in a per-thread scratch
+    buffer that is allocated once; larger reads get a one-off buffer.
+    """
+
+    _SCRATCH_SIZE = 4096
+
+    def __init__(self, process_handle: int) -> None:
+        import ctypes
+        import ctypes.wintypes as wt
+
+        fn = ctypes.WinDLL("ntdll").NtReadVirtualMemory
+        fn.argtypes = (
+            wt.HANDLE, ctypes.c_void_p, ctypes.c_void_p,
+            ctypes.c_size_t, ctypes.POINTER(ctypes.c_size_t),
+        )
+        fn.restype = ctypes.c_long  # NTSTATUS
+        self._ctypes = ctypes
+        self._fn = fn
+        self._handle = process_handle
+        self._local = threading.local()
+
+    def read_bytes(self, addr: int, size: int) -> bytes:
+        ctypes = self._ctypes
+        if size <= self._SCRATCH_SIZE:
+            buf = getattr(self._local, "scratch", None)
+            if buf is None:
+                buf = self._local.scratch = ctypes.create_string_buffer(self._SCRATCH_SIZE)
+        else:
+            buf = ctypes.create_string_buffer(size)
+        n_read = ctypes.c_size_t()
+        status = self._fn(self._handle, addr, buf, size, ctypes.byref(n_read))
+        # NTSTATUS < 0 is failure; so is a partial read (as with ReadProcessMemory)
+        if status < 0 or n_read.value != size:
+            raise DumperError(
+                f"NtReadVirtualMemory failed at 0x{addr:X} "
+                f"(status 0x{status & 0xFFFFFFFF:08X}, read {n_read.value}/{size})"
+            )
+        return ctypes.string_at(buf, size)
+
+
+def _unpack_ptrs(buf: bytes) -> list[int]:
+    """Reinterpret *buf* as little-endian uint64s in a single C-level copy."""
+    ptrs = array.array("Q")
+    ptrs.frombytes(buf)
+    if _BIG_ENDIAN_HOST:
+        ptrs.byteswap()  # the x64 target is little-endian
+    return ptrs.tolist()
+
+
+def _slice_cstring(buf: bytes, offset: int, max_len: int = _CSTRING_MAX_LEN) -> str:
+    """Decode the null-terminated string at *offset* inside a preloaded buffer."""
+    end = buf.find(b"\x00", offset, offset + max_len)
+    if end < 0:
+        end = min(offset + max_len, len(buf))
+    return buf[offset:end].decode("utf-8", errors="replace")
@@ -14,17 +14,18 @@ import logging
 import os
 import tempfile
 
-from PyQt6.QtCore import QThread
+from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import (
     QMainWindow,
     QStackedWidget,
     QWidget,
 )
 
+from src.gui.pages.feature_config import FeatureConfigPage
+from src.gui.pages.generate import GeneratePage
 from src.gui.pages.process_select import ProcessSelectPage
-from src.gui.pages.feature_config  import FeatureConfigPage
-from src.gui.pages.generate        import GeneratePage
-from src.gui.pages.script_manager  import ScriptManagerPage
+from src.gui.pages.script_manager import ScriptManagerPage
 from src.gui.worker import GenerateWorker
 from src.store.db import ScriptStore
 
@@ -42,6 +43,9 @@ PAGE_SCRIPT_MANAGER = 3
 class MainWindow(QMainWindow):
     """Root window: hosts the QStackedWidget and wires page navigation."""
 
+    # (exe_path, features) — queued to the long-lived GenerateWorker
+    _job_requested = pyqtSignal(str, list)
+
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("AI Trainer Generator")
@@ -51,9 +55,12 @@ class MainWindow(QMainWindow):
         _db_path = os.path.join(tempfile.gettempdir(), "ai_trainer_gen.db")
         self._store = ScriptStore(_db_path)
 
-        # Worker / thread references — kept to prevent premature GC
+        # Worker thread — created on the first run, then reused for every run
         self._thread: QThread | None = None
         self._worker: GenerateWorker | None = None
+        # A job is in flight; a close request waits for it to finish
+        self._job_running = False
+        self._close_pending = False
 
         self._build_ui()
         self._connect_navigation()
@@ -75,6 +82,8 @@ class MainWindow(QMainWindow):
         self._stack.addWidget(self._page_generate)  # 2
         self._stack.addWidget(self._page_scripts)   # 3
 
+        self._page_scripts.bind_store(self._store)
+
         self._stack.setCurrentIndex(PAGE_PROCESS_SELECT)
 
     # ── Navigation wiring ──────────────────────────────────────────────────
@@ -103,16 +112,11 @@ class MainWindow(QMainWindow):
     # ── Generate pipeline ──────────────────────────────────────────────────
 
     def _on_generate_clicked(self) -> None:
-        """Navigate to GeneratePage and launch the generation worker."""
-        # Clean up any previous run
-        if self._thread is not None and self._thread.isRunning():
-            self._thread.quit()
-            self._thread.wait(3000)  # wait up to 3s
-
+        """Navigate to GeneratePage and queue a job on the generation worker."""
         proc = self._page_process._vm.selected
         exe_path = proc.exe_path if proc else ""
 
-        features = list(self._page_features._vm.selected_features)
+        features = self._page_features._vm.selected_features_ordered
         custom = self._page_features._vm.custom_description.strip()
         if custom:
             features.append(custom)
@@ -121,37 +125,76 @@ class MainWindow(QMainWindow):
         self._page_generate.reset()
         self._page_generate._back_btn.setEnabled(False)
 
-        self._worker = GenerateWorker(
-            exe_path=exe_path,
-            features=features,
-            store=self._store,
-        )
-        self._thread = QThread()
+        self._ensure_worker()
+        self._job_running = True
+        self._job_requested.emit(exe_path, features)
+
+    def _ensure_worker(self) -> None:
+        """
+        Start the worker thread once and keep it for the window's lifetime.
+
+        Jobs are delivered through the queued _job_requested signal, so no
+        thread is spawned or torn down per click.
+        """
+        if self._thread is not None:
+            return
+
+        self._worker = GenerateWorker(store=self._store)
+        self._thread = QThread(self)
         self._worker.moveToThread(self._thread)
 
-        self._thread.started.connect(self._worker.run)
+        self._job_requested.connect(self._worker.start)
         self._worker.log_emitted.connect(self._page_generate.append_log)
         self._worker.progress_updated.connect(self._page_generate.set_progress)
         self._worker.finished.connect(self._on_generate_finished)
         self._worker.failed.connect(self._on_generate_failed)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.failed.connect(self._thread.quit)
+        self._thread.finished.connect(self._worker.deleteLater)
 
         self._thread.start()
 
     def _on_generate_finished(self, lua_path: str) -> None:
         """Called when the worker emits finished(lua_path)."""
+        self._job_running = False
+        if self._close_pending:
+            self.close()
+            return
         self._page_generate._back_btn.setEnabled(True)
         self._page_generate.append_log(f"Script saved: {lua_path}")
         self._page_generate.set_progress(1.0)
+        self._page_scripts.bind_store(self._store)  # pick up the new record
         self.go_to(PAGE_SCRIPT_MANAGER)
 
     def _on_generate_failed(self, error: str) -> None:
         """Called when the worker emits failed(error); stays on GeneratePage."""
+        self._job_running = False
+        if self._close_pending:
+            self.close()
+            return
         self._page_generate._back_btn.setEnabled(True)
         self._page_generate.append_log(f"Error: {error}")
         # Stay on GeneratePage so user can read the error
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """
+        Stop the worker thread and close the store before closing.
+
+        cmd_generate cannot be interrupted, so while a job is running the
+        close is deferred: the event is ignored and the window closes itself
+        once the worker reports finished or failed.
+        """
+        if self._job_running:
+            if not self._close_pending:
+                self._close_pending = True
+                self._page_generate.append_log("Closing once the current generation finishes…")
+            event.ignore()
+            return
+        if self._thread is not None:
+            # Idle worker: the event loop exits promptly, so wait without a timeout
+            self._thread.quit()
+            self._thread.wait()
+        self._store.close()
+        super().closeEvent(event)
+
     # ── Public API ─────────────────────────────────────────────────────────
 
     def go_to(self, page_index: int) -> None:
@@ -23,6 +23,7 @@ import logging
 
 from PyQt6.QtWidgets import (
     QCheckBox,
+    QGridLayout,
     QGroupBox,
     QHBoxLayout,
     QLabel,
@@ -50,6 +51,8 @@ _FEATURE_LABELS: dict[str, str] = {
     "godmode":           "God Mode",
 }
 
+_GRID_COLUMNS = 2
+
 
 class FeatureConfigPage(QWidget):
     """Second page: choose what the trainer should do."""
@@ -57,7 +60,8 @@ class FeatureConfigPage(QWidget):
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
         self._vm = FeatureConfigViewModel()
-        self._checkboxes: dict[str, QCheckBox] = {}
+        # Same order as self._vm.standard_features
+        self._checkboxes: list[QCheckBox] = []
         self._build_ui()
 
     # ── UI construction ────────────────────────────────────────────────────
@@ -70,15 +74,17 @@ class FeatureConfigPage(QWidget):
         # Title
         layout.addWidget(QLabel("<b>Configure Trainer Features</b>"))
 
-        # Standard-feature checkboxes
+        # Standard-feature checkboxes, two per row
         group = QGroupBox("Standard Features")
-        grid = QVBoxLayout(group)
-        for feature_id in self._vm.standard_features:
+        grid = QGridLayout(group)
+        for i, feature_id in enumerate(self._vm.standard_features):
             label = _FEATURE_LABELS.get(feature_id, feature_id.replace("_", " ").title())
             cb = QCheckBox(label)
-            cb.toggled.connect(lambda checked, fid=feature_id: self._on_toggle(fid, checked))
-            self._checkboxes[feature_id] = cb
-            grid.addWidget(cb)
+            # One shared slot; feature_id rides on a widget property, not a closure per row
+            cb.setProperty("fid", feature_id)
+            cb.toggled.connect(self._on_toggle_sender)
+            self._checkboxes.append(cb)
+            grid.addWidget(cb, *divmod(i, _GRID_COLUMNS))
         layout.addWidget(group)
 
         # Custom description
@@ -101,6 +107,10 @@ class FeatureConfigPage(QWidget):
 
     # ── Slots ──────────────────────────────────────────────────────────────
 
+    def _on_toggle_sender(self, checked: bool) -> None:
+        """Shared slot for every feature checkbox; the sender carries its id."""
+        self._on_toggle(self.sender().property("fid"), checked)
+
     def _on_toggle(self, feature_id: str, checked: bool) -> None:
         if checked and feature_id not in self._vm.selected_features:
             self._vm.toggle(feature_id)
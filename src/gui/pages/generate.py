@@ -19,7 +19,10 @@ Layout
 """
 
 import logging
+from collections import deque
 
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -30,12 +33,19 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
-from src.gui.viewmodels import GenerateViewModel, GenerateState
+from src.gui.viewmodels import MAX_LOG_LINES, GenerateViewModel
 
 __all__ = ["GeneratePage"]
 
 logger = logging.getLogger(__name__)
 
+# Log lines arriving within this window are appended to the view in one pass
+_LOG_FLUSH_MS = 100
+
+# A line identical to one of this many most recent lines is not displayed
+# again (e.g. repeated "Scanning…" ticks)
+_RECENT_LOG_LINES = 4
+
 
 class GeneratePage(QWidget):
     """Third page: watch the LLM generate the Lua trainer script."""
@@ -43,8 +53,16 @@ class GeneratePage(QWidget):
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
         self._vm = GenerateViewModel()
+        self._pending_log: list[str] = []
+        self._recent_log: deque[str] = deque(maxlen=_RECENT_LOG_LINES)
+        self._last_pct = 0
         self._build_ui()
 
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(_LOG_FLUSH_MS)
+        self._flush_timer.timeout.connect(self._flush_log)
+
     # ── UI construction ────────────────────────────────────────────────────
 
     def _build_ui(self) -> None:
@@ -58,8 +76,15 @@ class GeneratePage(QWidget):
         # Log display
         self._log_view = QPlainTextEdit()
         self._log_view.setReadOnly(True)
+        # Capped block count drops old lines, so document/layout cost stays flat
+        # over a long run; a log needs no undo stack
+        self._log_view.setMaximumBlockCount(MAX_LOG_LINES)
+        self._log_view.setUndoRedoEnabled(False)
         self._log_view.setPlaceholderText("Generation output will appear here…")
         layout.addWidget(self._log_view)
+        # Write cursor separate from the view's: appends keep the user's selection
+        # and scroll position
+        self._log_cursor = QTextCursor(self._log_view.document())
 
         # Progress bar
         self._progress_bar = QProgressBar()
@@ -78,17 +103,60 @@ class GeneratePage(QWidget):
     # ── Public helpers ──────────────────────────────────────────────────────
 
     def append_log(self, message: str) -> None:
-        """Append a line to the log display and update the ViewModel."""
+        """
+        Append a line to the ViewModel now and to the log display shortly.
+
+        Display updates are batched: bursts of lines within _LOG_FLUSH_MS
+        cost one append / layout pass instead of one per line.  A repeat of a
+        recent line is left out of the display only; the ViewModel keeps the
+        full log history.
+        """
         self._vm.append_log(message)
-        self._log_view.appendPlainText(message)
+        if message in self._recent_log:
+            return
+        self._recent_log.append(message)
+        self._pending_log.append(message)
+        # Don't restart the timer: steady output still flushes once per interval
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def set_progress(self, value: float) -> None:
         """Set progress (0.0 – 1.0) and update the progress bar."""
         self._vm.set_progress(value)
-        self._progress_bar.setValue(int(self._vm.progress * 100))
+        pct = int(self._vm.progress * 100)
+        # Skip setValue when unchanged to avoid a needless repaint
+        if pct != self._last_pct:
+            self._last_pct = pct
+            self._progress_bar.setValue(pct)
 
     def reset(self) -> None:
         """Reset log and progress for a fresh generation run."""
         self._vm.start()
+        self._flush_timer.stop()
+        self._pending_log.clear()
+        self._recent_log.clear()
         self._log_view.clear()
+        self._last_pct = 0
         self._progress_bar.setValue(0)
+
+    # ── Internal helpers ───────────────────────────────────────────────────
+
+    def _flush_log(self) -> None:
+        """
+        Write all pending lines to the end of the log document in one insert.
+
+        The view follows new output only while it is scrolled to the bottom;
+        if the user has scrolled up to read, the position is left alone.
+        """
+        if not self._pending_log:
+            return
+        bar = self._log_view.verticalScrollBar()
+        follow = bar.value() >= bar.maximum()
+        text = "\n".join(self._pending_log)
+        if not self._log_view.document().isEmpty():
+            text = "\n" + text
+        self._log_cursor.movePosition(QTextCursor.MoveOperation.End)
+        self._log_cursor.insertText(text)
+        self._pending_log.clear()
+        if follow:
+            bar.setValue(bar.maximum())
@@ -17,7 +17,10 @@ Layout
 """
 
 import logging
+import threading
+import time
 
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -34,6 +37,72 @@ __all__ = ["ProcessSelectPage"]
 
 logger = logging.getLogger(__name__)
 
+# Refreshes within this many seconds reuse the previous scan
+_SCAN_TTL_S = 2.0
+
+# (monotonic timestamp, processes) of the last completed scan
+_scan_cache: tuple[float, list[ProcessInfo]] | None = None
+_scan_lock = threading.Lock()
+
+
+def _scan_processes() -> list[ProcessInfo]:
+    """
+    Enumerate running processes (pid, name, exe) via psutil.
+
+    Slow on Windows, so callers run it off the GUI thread; results are
+    memoised for _SCAN_TTL_S so rapid repeated refreshes are free.
+    """
+    global _scan_cache
+    with _scan_lock:
+        if _scan_cache is not None and time.monotonic() - _scan_cache[0] < _SCAN_TTL_S:
+            return list(_scan_cache[1])
+
+    try:
+        import psutil
+    except ImportError:
+        # psutil not available — show placeholder entries
+        return [ProcessInfo(pid=0, name="(psutil not installed — demo mode)", exe_path="")]
+
+    procs = []
+    # Ask only for the needed attributes; psutil fetches them in one batch
+    # (p.info then costs no extra syscalls)
+    for p in psutil.process_iter(["pid", "name", "exe"]):
+        try:
+            info = p.info
+            procs.append(ProcessInfo(
+                pid=info["pid"],
+                name=info["name"] or "",
+                exe_path=info.get("exe") or "",
+            ))
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    with _scan_lock:
+        _scan_cache = (time.monotonic(), procs)
+    return list(procs)
+
+
+class _ScanSignals(QObject):
+    processes_ready = pyqtSignal(list)   # list[ProcessInfo]
+    scan_failed     = pyqtSignal(str)
+
+
+class _ProcessScanTask(QRunnable):
+    """Runs _scan_processes on the global thread pool and reports via signals."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _ScanSignals()
+
+    def run(self) -> None:
+        try:
+            procs = _scan_processes()
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Process scan failed")
+            self.signals.scan_failed.emit(str(exc))
+            return
+        self.signals.processes_ready.emit(procs)
+
 
 class ProcessSelectPage(QWidget):
     """
@@ -46,6 +115,7 @@ class ProcessSelectPage(QWidget):
     def __init__(self, parent: QWidget = None) -> None:
         super().__init__(parent)
         self._vm = ProcessListViewModel()
+        self._scan_task: _ProcessScanTask | None = None
         self._build_ui()
 
     # ── UI construction ────────────────────────────────────────────────────
@@ -88,33 +158,28 @@ class ProcessSelectPage(QWidget):
 
     def _on_filter_changed(self, text: str) -> None:
         self._vm.filter_text = text
-        self._refresh_list()
+        self._apply_filter()
 
     def _on_refresh(self) -> None:
-        """Scan running processes and populate the list."""
-        try:
-            import psutil
-            procs = []
-            for p in psutil.process_iter(["pid", "name", "exe"]):
-                try:
-                    info = p.info
-                    procs.append(ProcessInfo(
-                        pid=info["pid"],
-                        name=info["name"] or "",
-                        exe_path=info.get("exe") or "",
-                    ))
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        except ImportError:
-            # psutil not available — show placeholder entries
-            procs = [ProcessInfo(pid=0, name="(psutil not installed — demo mode)", exe_path="")]
+        """Scan running processes on a worker thread; the list fills in when done."""
+        self._refresh_btn.setEnabled(False)
+        task = _ProcessScanTask()
+        task.signals.processes_ready.connect(self._on_processes_ready)
+        task.signals.scan_failed.connect(lambda _msg: self._refresh_btn.setEnabled(True))
+        self._scan_task = task  # keep the signals object alive until delivery
+        QThreadPool.globalInstance().start(task)
+
+    def _on_processes_ready(self, procs: list) -> None:
+        self._refresh_btn.setEnabled(True)
         self._vm.set_processes(procs)
-        self._refresh_list()
+        self._rebuild_list()
 
     def _on_row_changed(self, row: int) -> None:
-        filtered = self._vm.filtered_processes
-        if 0 <= row < len(filtered):
-            self._vm.select(filtered[row])
+        # List rows map 1:1 to self._vm.processes (filtering hides rows, never removes them)
+        procs = self._vm.processes
+        item = self._list_widget.item(row)
+        if 0 <= row < len(procs) and item is not None and not item.isHidden():
+            self._vm.select(procs[row])
             self._select_btn.setEnabled(True)
         else:
             self._vm.selected = None
@@ -122,7 +187,31 @@ class ProcessSelectPage(QWidget):
 
     # ── Internal helpers ───────────────────────────────────────────────────
 
-    def _refresh_list(self) -> None:
-        self._list_widget.clear()
-        for proc in self._vm.filtered_processes:
-            self._list_widget.addItem(str(proc))
+    def _rebuild_list(self) -> None:
+        """Recreate one item per process; only needed when the process set changes."""
+        lw = self._list_widget
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            lw.clear()
+            lw.addItems([str(proc) for proc in self._vm.processes])
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
+        self._apply_filter()
+
+    def _apply_filter(self) -> None:
+        """Hide items that do not match the filter instead of rebuilding the list."""
+        lw = self._list_widget
+        visible = {id(proc) for proc in self._vm.filtered_processes}
+        lw.setUpdatesEnabled(False)
+        try:
+            for row, proc in enumerate(self._vm.processes):
+                lw.item(row).setHidden(id(proc) not in visible)
+        finally:
+            lw.setUpdatesEnabled(True)
+
+        current = lw.currentItem()
+        if current is not None and current.isHidden():
+            lw.setCurrentRow(-1)
+        self._on_row_changed(lw.currentRow())
@@ -19,20 +19,28 @@ Layout
 
 import logging
 
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRegularExpression,
+    QSortFilterProxyModel,
+    Qt,
+)
 from PyQt6.QtWidgets import (
+    QAbstractItemView,
     QHBoxLayout,
     QLabel,
     QLineEdit,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 from src.gui.viewmodels import ScriptManagerViewModel
 
-__all__ = ["ScriptManagerPage"]
+__all__ = ["ScriptManagerPage", "ScriptRecordModel"]
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +51,96 @@ _COL_FEATURE = 2
 _COL_STATS   = 3
 _HEADERS = ["ID", "Game", "Feature", "OK / Fail"]
 
+# Role carrying the pre-folded game name that the search proxy filters on
+_FILTER_ROLE = Qt.ItemDataRole.UserRole
+# \w / \W in the search pattern must be Unicode-aware, like Python's re
+_PATTERN_OPTIONS = QRegularExpression.PatternOption.UseUnicodePropertiesOption
+
+
+class ScriptRecordModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of ScriptRecord.
+
+    Cells are produced on demand by data(), so the view only renders the
+    visible rows instead of allocating a QTableWidgetItem per cell.  Game
+    names are folded (ScriptManagerViewModel.search_key) once per load and
+    served under _FILTER_ROLE.
+
+    With a *pager* (an object exposing ``has_more`` and ``fetch_more()``,
+    i.e. a store-bound ScriptManagerViewModel) further rows are appended
+    through Qt's canFetchMore / fetchMore as the view scrolls.
+    """
+
+    def __init__(self, parent: QObject = None) -> None:
+        super().__init__(parent)
+        self._records: list = []
+        self._game_keys: list[str] = []
+        self._pager = None
+
+    def set_records(self, records, pager=None) -> None:
+        """Replace the rows (list[ScriptRecord]) with a single model reset."""
+        self.beginResetModel()
+        self._records = list(records)
+        self._game_keys = [ScriptManagerViewModel.search_key(r.game_name) for r in self._records]
+        self._pager = pager
+        self.endResetModel()
+
+    def canFetchMore(self, parent: QModelIndex | None = None) -> bool:
+        if parent is not None and parent.isValid():
+            return False
+        return self._pager is not None and self._pager.has_more
+
+    def fetchMore(self, parent: QModelIndex | None = None) -> None:
+        if not self.canFetchMore(parent):
+            return
+        batch = self._pager.fetch_more()
+        if not batch:
+            return
+        first = len(self._records)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._records.extend(batch)
+        self._game_keys.extend(ScriptManagerViewModel.search_key(r.game_name) for r in batch)
+        self.endInsertRows()
+
+    def record(self, row: int):
+        """Return the ScriptRecord shown at *row*."""
+        return self._records[row]
+
+    def rowCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(self._records)
+
+    def columnCount(self, parent: QModelIndex | None = None) -> int:
+        return 0 if parent is not None and parent.isValid() else len(_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == _FILTER_ROLE:
+            return self._game_keys[index.row()] if index.column() == _COL_GAME else None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        rec = self._records[index.row()]
+        col = index.column()
+        if col == _COL_ID:
+            return str(rec.id or "")
+        if col == _COL_GAME:
+            return rec.game_name
+        if col == _COL_FEATURE:
+            return rec.feature
+        if col == _COL_STATS:
+            return f"{rec.success_count} / {rec.fail_count}"
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _HEADERS[section]
+        return None
+
 
 class ScriptManagerPage(QWidget):
     """Fourth page: browse, search, and export cached trainer scripts."""
@@ -71,11 +169,19 @@ class ScriptManagerPage(QWidget):
         search_row.addWidget(self._search_edit)
         layout.addLayout(search_row)
 
-        # Script table
-        self._table = QTableWidget(0, len(_HEADERS))
-        self._table.setHorizontalHeaderLabels(_HEADERS)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        # Script table (model/view: cells are rendered on demand).  Search is
+        # the view model's word-prefix pattern, applied by the proxy to the
+        # folded game column — the same matching ScriptStore.search does.
+        self._model = ScriptRecordModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setFilterKeyColumn(_COL_GAME)
+        self._proxy.setFilterRole(_FILTER_ROLE)
+        self._proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseSensitive)
+        self._table = QTableView()
+        self._table.setModel(self._proxy)
+        self._table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self._table)
 
@@ -92,17 +198,17 @@ class ScriptManagerPage(QWidget):
 
     def _on_search_changed(self, text: str) -> None:
         self._vm.search_query = text
-        self._refresh_table()
+        if self._vm.store is not None:
+            # A bound store filters in SQL and re-reads the pages
+            self.bind_store(self._vm.store)
+        else:
+            self._proxy.setFilterRegularExpression(
+                QRegularExpression(self._vm.search_pattern, _PATTERN_OPTIONS)
+            )
 
     def _refresh_table(self) -> None:
-        records = self._vm.visible_records
-        self._table.setRowCount(len(records))
-        for row, rec in enumerate(records):
-            self._table.setItem(row, _COL_ID,      QTableWidgetItem(str(rec.id or "")))
-            self._table.setItem(row, _COL_GAME,     QTableWidgetItem(rec.game_name))
-            self._table.setItem(row, _COL_FEATURE,  QTableWidgetItem(rec.feature))
-            self._table.setItem(row, _COL_STATS,
-                                QTableWidgetItem(f"{rec.success_count} / {rec.fail_count}"))
+        pager = self._vm if self._vm.store is not None else None
+        self._model.set_records(self._vm.records, pager)
 
     # ── Public API ─────────────────────────────────────────────────────────
 
@@ -110,3 +216,14 @@ class ScriptManagerPage(QWidget):
         """Populate the table with *records* (list[ScriptRecord])."""
         self._vm.load(records)
         self._refresh_table()
+
+    def bind_store(self, store) -> None:
+        """
+        Show the records of *store* (a ScriptStore), read in windows of
+        SCRIPT_PAGE_SIZE as the table scrolls instead of all at once.
+        Call again to pick up new records.
+        """
+        self._proxy.setFilterFixedString("")
+        self._vm.bind_store(store)
+        self._vm.fetch_more()
+        self._refresh_table()
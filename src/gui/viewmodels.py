@@ -15,10 +15,13 @@ GenerateViewModel        — manages generation log + progress + state
 ScriptManagerViewModel   — manages cached script list + search
 """
 
+import functools
 import logging
+import re
+import unicodedata
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
 
 from src.store.models import ScriptRecord
 
@@ -34,11 +37,127 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+# ── Filtering helper ───────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=64)
+def _wildcard_search(term: str):
+    """Compiled search() for a lowercased term with * / ? wildcards."""
+    pattern = re.escape(term).replace(r"\*", ".*").replace(r"\?", ".")
+    return re.compile(pattern, re.DOTALL).search
+
+
+def _term_test(term: str):
+    """Predicate telling whether a lowercased key matches *term*."""
+    if "*" in term or "?" in term:
+        return _wildcard_search(term)
+    return lambda key: term in key
+
+
+class _SubstringIndex:
+    """
+    Lowercased keys for repeated case-insensitive substring filtering.
+
+    A query is split on whitespace and a key matches when it contains every
+    term.  Plain terms are fixed-string ``in`` tests; a term with ``*`` or
+    ``?`` is matched as a wildcard pattern anywhere in the key, compiled once
+    per distinct term.  Keys are lowercased once, not on every query.  When each term of
+    the previous query lies inside some term of the new one (the usual
+    keystroke-by-keystroke typing), only the previous hits are rescanned,
+    since nothing outside them can match.
+    """
+
+    def __init__(self, keys: list[str]) -> None:
+        self._keys = [k.lower() for k in keys]
+        self._last_terms: list[str] = []
+        self._last_hits: list[int] = list(range(len(self._keys)))
+
+    def matches(self, query: str) -> list[int]:
+        """Indices of keys containing every term of *query* (case-insensitive), in order."""
+        terms = query.lower().split()
+        keys = self._keys
+        narrows = all(any(old in new for new in terms) for old in self._last_terms)
+        candidates = self._last_hits if narrows else range(len(keys))
+        if len(terms) == 1 and "*" not in terms[0] and "?" not in terms[0]:
+            # Common case: one plain term, a direct `in` test without regex
+            q = terms[0]
+            hits = [i for i in candidates if q in keys[i]]
+        else:
+            tests = [_term_test(t) for t in terms]
+            hits = [i for i in candidates if all(test(keys[i]) for test in tests)]
+        self._last_terms, self._last_hits = terms, hits
+        return hits
+
+
+# A word as the store's FTS5 (unicode61) tokenizer sees it: letters and digits
+_WORD_RE = re.compile(r"[^\W_]+")
+# Start of a word: not preceded by a letter or digit
+_WORD_START = r"(?<![^\W_])"
+
+
+def _fold(text: str) -> str:
+    """Casefold *text* and strip diacritics, as the FTS5 tokenizer does."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def _word_prefix_pattern(query: str) -> str:
+    """
+    Regex source matching folded keys in which every term of *query* prefixes
+    a word — the semantics of ScriptStore.search().
+
+    A term spanning punctuation ("half-li") must match consecutive words; a
+    term with no letters or digits matches nothing, as in FTS5.
+    """
+    parts = []
+    for term in _fold(query).split():
+        words = _WORD_RE.findall(term)
+        if not words:
+            return "(?!)"
+        parts.append("(?=.*?" + _WORD_START + r"[\W_]+".join(map(re.escape, words)) + ")")
+    return "^" + "".join(parts) if parts else ""
+
+
+@functools.lru_cache(maxsize=64)
+def _word_prefix_search(query: str):
+    """Compiled search() for _word_prefix_pattern(*query*)."""
+    return re.compile(_word_prefix_pattern(query), re.DOTALL).search
+
+
+class _WordPrefixIndex:
+    """
+    Folded keys for repeated word-prefix filtering (see _word_prefix_pattern).
+
+    Keys are folded once, not on every query.  When each term of the previous
+    query is a prefix of some term of the new one, only the previous hits are
+    rescanned, since nothing outside them can match.
+    """
+
+    def __init__(self, keys: list[str]) -> None:
+        self._keys = [_fold(k) for k in keys]
+        self._last_terms: list[str] = []
+        self._last_hits: list[int] = list(range(len(self._keys)))
+
+    def matches(self, query: str) -> list[int]:
+        """Indices of keys matching *query* word by word, in order."""
+        terms = _fold(query).split()
+        keys = self._keys
+        narrows = all(any(new.startswith(old) for new in terms) for old in self._last_terms)
+        candidates = self._last_hits if narrows else range(len(keys))
+        search = _word_prefix_search(query)
+        hits = [i for i in candidates if search(keys[i])]
+        if not all(_WORD_RE.search(t) for t in terms):
+            # A term without letters or digits matches nothing and cannot seed narrowing
+            self._last_terms, self._last_hits = [], list(range(len(keys)))
+        else:
+            self._last_terms, self._last_hits = terms, hits
+        return hits
+
+
 # ── ProcessListViewModel ───────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ProcessInfo:
-    """Lightweight descriptor for a running OS process."""
+    """Lightweight, immutable (hashable) descriptor for a running OS process."""
     pid:      int
     name:     str
     exe_path: str = ""  # absolute path to the process executable, if accessible
@@ -54,7 +173,8 @@ class ProcessListViewModel:
     Attributes
     ──────────
     processes         — full list (set by refresh)
-    filter_text       — substring to match against process names (case-insensitive)
+    filter_text       — whitespace-separated terms that process names must all
+                        contain (case-insensitive; * and ? are wildcards)
     selected          — the currently chosen ProcessInfo, or None
     filtered_processes — derived: processes whose name contains filter_text
     """
@@ -62,13 +182,19 @@ class ProcessListViewModel:
     def __init__(self) -> None:
         self.processes:   list[ProcessInfo]       = []
         self.filter_text: str                      = ""
-        self.selected:    Optional[ProcessInfo]    = None
+        self.selected:    ProcessInfo | None    = None
+        # Name index for filtered_processes, rebuilt when processes is replaced
+        self._index: _SubstringIndex | None = None
+        self._indexed: list[ProcessInfo] | None = None
+        # Set view of the last set_processes() list, for O(1) membership tests
+        self._procset: frozenset[ProcessInfo] = frozenset()
 
     def set_processes(self, processes: list[ProcessInfo]) -> None:
         """Replace the process list (called after OS scan)."""
         self.processes = list(processes)
+        self._procset = frozenset(self.processes)
         # Clear selection if selected process is no longer in the list
-        if self.selected and self.selected not in self.processes:
+        if self.selected and self.selected not in self._procset:
             self.selected = None
 
     @property
@@ -76,8 +202,11 @@ class ProcessListViewModel:
         """Return processes matching the current filter_text (case-insensitive)."""
         if not self.filter_text:
             return list(self.processes)
-        query = self.filter_text.lower()
-        return [p for p in self.processes if query in p.name.lower()]
+        procs = self.processes
+        if self._indexed is not procs:
+            self._index = _SubstringIndex([p.name for p in procs])
+            self._indexed = procs
+        return [procs[i] for i in self._index.matches(self.filter_text)]
 
     def select(self, process: ProcessInfo) -> None:
         """Mark *process* as selected."""
@@ -106,21 +235,28 @@ class FeatureConfigViewModel:
     Attributes
     ──────────
     standard_features    — fixed list of built-in feature ids
-    selected_features    — features the user has toggled on
+    selected_features    — set of features the user has toggled on
     custom_description   — optional free-text feature description
+    selected_features_ordered — derived: selected_features in display order
     """
 
     def __init__(self) -> None:
         self.standard_features:  list[str] = list(_STANDARD_FEATURES)
-        self.selected_features:  list[str] = []
+        self.selected_features:  set[str]  = set()
         self.custom_description: str        = ""
 
     def toggle(self, feature: str) -> None:
         """Add *feature* if not selected; remove it if already selected."""
-        if feature in self.selected_features:
-            self.selected_features.remove(feature)
-        else:
-            self.selected_features.append(feature)
+        self.selected_features ^= {feature}
+
+    @property
+    def selected_features_ordered(self) -> list[str]:
+        """Selected features in standard_features order, then any others sorted."""
+        selected = self.selected_features
+        ordered = [f for f in self.standard_features if f in selected]
+        if len(ordered) < len(selected):
+            ordered += sorted(selected.difference(self.standard_features))
+        return ordered
 
     @property
     def has_selection(self) -> bool:
@@ -130,6 +266,10 @@ class FeatureConfigViewModel:
 
 # ── GenerateViewModel ──────────────────────────────────────────────────────────
 
+# Log lines kept per run; older lines are dropped (matches the GeneratePage view)
+MAX_LOG_LINES = 1000
+
+
 class GenerateState(str, Enum):
     IDLE    = "idle"
     RUNNING = "running"
@@ -143,13 +283,13 @@ class GenerateViewModel:
 
     Attributes
     ──────────
-    log_lines — list of log message strings (newest last)
+    log_lines — the last MAX_LOG_LINES log message strings (newest last)
     progress  — float in [0.0, 1.0]
     state     — GenerateState
     """
 
     def __init__(self) -> None:
-        self.log_lines: list[str]   = []
+        self.log_lines: deque[str]   = deque(maxlen=MAX_LOG_LINES)
         self.progress:  float        = 0.0
         self.state:     GenerateState = GenerateState.IDLE
 
@@ -180,32 +320,89 @@ class GenerateViewModel:
 
 # ── ScriptManagerViewModel ─────────────────────────────────────────────────────
 
+# Records fetched per window when paging from a ScriptStore
+SCRIPT_PAGE_SIZE = 200
+
+
 class ScriptManagerViewModel:
     """
     Manages the cached script history shown in the script manager page.
 
+    Records are either loaded in full with load(), or paged in windows of
+    SCRIPT_PAGE_SIZE from a bound ScriptStore (bind_store / fetch_more), in
+    which case search_query is applied by the store's SQL query.
+
     Attributes
     ──────────
-    records       — full list of ScriptRecord objects
-    search_query  — substring filter applied to game_name
+    records       — loaded ScriptRecord objects (all, or the pages fetched so far)
+    search_query  — words that must each prefix a word of game_name
+                    (case- and accent-insensitive, as ScriptStore.search)
     selected      — currently highlighted record, or None
-    visible_records — derived: records matching search_query
+    store         — bound ScriptStore for windowed loading, or None
+    total_count   — number of records matching search_query in the bound store
+    visible_records — derived: records matching search_query (already
+                      filtered by the store's full-text search when bound)
+    has_more      — derived: bound store holds matching records not yet fetched
     """
 
     def __init__(self) -> None:
         self.records:      list[ScriptRecord]   = []
         self.search_query: str                   = ""
-        self.selected:     Optional[ScriptRecord] = None
+        self.selected:     ScriptRecord | None = None
+        self.store                               = None
+        self.total_count:  int                   = 0
+        # game_name index for visible_records, rebuilt when records is replaced
+        self._index: _WordPrefixIndex | None = None
+        self._indexed: list[ScriptRecord] | None = None
 
     def load(self, records: list[ScriptRecord]) -> None:
         """Replace the record list (e.g. after a Store.search() call)."""
+        self.store = None
         self.records = list(records)
+        self.total_count = len(self.records)
+        self.selected = None
+
+    def bind_store(self, store) -> None:
+        """
+        Page records lazily from *store* (a ScriptStore) for search_query.
+
+        Drops the loaded records and re-counts matches; call again after
+        changing search_query or the store contents.
+        """
+        self.store = store
+        self.records = []
         self.selected = None
+        self.total_count = store.count(self.search_query)
+
+    @property
+    def has_more(self) -> bool:
+        return self.store is not None and len(self.records) < self.total_count
+
+    def fetch_more(self, limit: int = SCRIPT_PAGE_SIZE) -> list[ScriptRecord]:
+        """Fetch the next window of matching records from the bound store."""
+        if not self.has_more:
+            return []
+        batch = self.store.search(self.search_query, limit=limit, offset=len(self.records))
+        self.records = self.records + batch
+        return batch
+
+    @property
+    def search_pattern(self) -> str:
+        """Regex source for search_query, matched against search_key(game_name)."""
+        return _word_prefix_pattern(self.search_query)
+
+    @staticmethod
+    def search_key(game_name: str) -> str:
+        """Folded form of *game_name* that search_pattern is matched against."""
+        return _fold(game_name)
 
     @property
     def visible_records(self) -> list[ScriptRecord]:
-        """Return records whose game_name contains search_query (case-insensitive)."""
-        if not self.search_query:
+        """Return records whose game_name matches search_query word by word."""
+        if not self.search_query or self.store is not None:
             return list(self.records)
-        q = self.search_query.lower()
-        return [r for r in self.records if q in r.game_name.lower()]
+        records = self.records
+        if self._indexed is not records:
+            self._index = _WordPrefixIndex([r.game_name for r in records])
+            self._indexed = records
+        return [records[i] for i in self._index.matches(self.search_query)]
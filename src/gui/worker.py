@@ -3,16 +3,18 @@ GenerateWorker — runs the full ai-trainer-gen pipeline in a background thread.
 
 Usage (MainWindow)::
 
-    self._thread = QThread()
-    self._worker = GenerateWorker(exe_path, features, store)
+    # once — the thread and worker live for the whole window lifetime
+    self._thread = QThread(self)
+    self._worker = GenerateWorker(store=store)
     self._worker.moveToThread(self._thread)
-    self._thread.started.connect(self._worker.run)
-    self._worker.finished.connect(self._thread.quit)
-    self._worker.failed.connect(self._thread.quit)
+    self._job_requested.connect(self._worker.start)
     self._worker.log_emitted.connect(self._page_generate.append_log)
     self._worker.progress_updated.connect(self._page_generate.set_progress)
     self._thread.start()
 
+    # per run — queued onto the worker thread
+    self._job_requested.emit(exe_path, features)
+
 Signals
 ───────
 log_emitted(str)       — one log line per pipeline step
@@ -22,9 +24,8 @@ failed(str)            — human-readable error message
 """
 
 import logging
-from typing import List
 
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.cli.main import cmd_generate
 
@@ -48,30 +49,46 @@ class GenerateWorker(QObject):
 
     def __init__(
         self,
-        exe_path: str,
-        features: List[str],
-        store,
+        exe_path: str = "",
+        features: list[str] | None = None,
+        store=None,
         backend: str = "stub",
         model:   str = "",
         api_key: str = "",
     ) -> None:
         super().__init__()
         self._exe_path = exe_path
-        self._features = features
+        self._features = features or []
         self._store    = store
         self._backend  = backend
         self._model    = model
         self._api_key  = api_key
 
+    @pyqtSlot(str, list)
+    def start(self, exe_path: str, features: list) -> None:
+        """Run one generation job; lets a long-lived worker serve many runs."""
+        self._exe_path = exe_path
+        self._features = features
+        self.run()
+
     def run(self) -> None:
         """Entry point — connect QThread.started to this slot."""
         # Multiple selected features are joined into one request string;
         # cmd_generate's LLM will treat it as a combined custom feature.
         feature = ", ".join(self._features) if self._features else "general"
 
+        last: dict = {"line": None, "pct": None}
+
         def on_progress(pct: float, msg: str) -> None:
-            self.log_emitted.emit(f"[{int(pct * 100):3d}%] {msg}")
-            self.progress_updated.emit(pct)
+            # Repeated log lines and unchanged whole percentages are not sent across threads
+            percent = int(pct * 100)
+            line = f"[{percent:3d}%] {msg}"
+            if line != last["line"]:
+                last["line"] = line
+                self.log_emitted.emit(line)
+            if percent != last["pct"]:
+                last["pct"] = percent
+                self.progress_updated.emit(pct)
 
         try:
             out_path = cmd_generate(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 from .base import AbstractResolver
 from .il2cpp_resolver import IL2CPPResolver
 from .models import ResolutionStrategy
@@ -10,15 +12,21 @@ from .unreal_resolver import UnrealResolver
 
 __all__ = ["get_resolver"]
 
-_RESOLVER_MAP: dict[str, AbstractResolver] = {
-    "Unity_Mono":   MonoResolver(),
-    "Unity_IL2CPP": IL2CPPResolver(),
-    "UE4":          UnrealResolver(),
-    "UE5":          UnrealResolver(),
+_RESOLVER_MAP: dict[str, type[AbstractResolver]] = {
+    "Unity_Mono":   MonoResolver,
+    "Unity_IL2CPP": IL2CPPResolver,
+    "UE4":          UnrealResolver,
+    "UE5":          UnrealResolver,
 }
 
 # Default fallback — used when engine is Unknown
-_FALLBACK = IL2CPPResolver()
+_FALLBACK = IL2CPPResolver
+
+
+@functools.cache
+def _instance(cls: type[AbstractResolver]) -> AbstractResolver:
+    """One shared resolver per class, created on first use rather than at import."""
+    return cls()
 
 
 def get_resolver(engine_type: str) -> AbstractResolver:
@@ -34,4 +42,4 @@ def get_resolver(engine_type: str) -> AbstractResolver:
     AbstractResolver appropriate for that engine.
     Falls back to IL2CPPResolver (pointer-chain) for unknown engines.
     """
-    return _RESOLVER_MAP.get(engine_type, _FALLBACK)
+    return _instance(_RESOLVER_MAP.get(engine_type, _FALLBACK))
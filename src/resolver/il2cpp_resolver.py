@@ -20,13 +20,14 @@ because:
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.dumper.models import StructureJSON
 
 from .base import AbstractResolver
-from .models import EngineContext, FieldResolution, ResolutionStrategy
+from .models import EngineContext, FieldResolution, ResolutionStrategy, _ce_read, _ce_write
 
 __all__ = ["IL2CPPResolver"]
 
@@ -37,6 +38,54 @@ _SINGLETON_AOB_HINT = "48 8B 05 ?? ?? ?? ?? 48 85 C0 74 ?? 48 8B 40"
 # Pointer size by bitness
 _PTR_SIZE = {32: 4, 64: 8}
 
+# preamble_lua() body; str.format fields: module, bitness, ptr_size, aob_hint
+_PREAMBLE_TEMPLATE = """\
+-- ── IL2CPP pointer-chain helpers ─────────────────────────────────────────────
+-- Module : {module}
+-- Bitness: {bitness}-bit  (pointer size = {ptr_size} bytes)
+--
+-- Strategy: ONE root AOB per class → pointer chain → known field offset
+-- Field offsets are static (AoT compilation) — no per-field AOB needed.
+
+local _baseCache = {{}}
+
+-- Resolve a RIP-relative MOV instruction to its target address:
+--   48 8B 05 [offset32]  →  next_instr_addr + offset32
+local function _resolveRIP(matchAddr)
+  local rel = readInteger(matchAddr + 3)    -- 4-byte signed offset
+  return (matchAddr + 7 + rel)              -- RIP = matchAddr + 7
+end
+
+-- Generic AOB root finder: scans for pattern, resolves RIP pointer,
+-- then walks an optional pointer chain.
+-- chain: list of pointer offsets, e.g. {{0x20, 0x58}}
+local function _findRoot(aobPattern, chain)
+  local match = AOBScan(aobPattern, "{module}")
+  if not match then return nil end
+  local addr = readPointer(_resolveRIP(match))  -- dereference static ptr
+  for _, off in ipairs(chain or {{}}) do
+    if addr == 0 then return nil end
+    addr = readPointer(addr + off)
+  end
+  return addr
+end
+
+-- TODO: Implement per-class base finders, using the AOB hint below.
+-- Singleton pattern hint: "{aob_hint}"
+-- Example:
+--   local function _getBase_PlayerController()
+--     if not _baseCache["PlayerController"] then
+--       -- Find singleton root (scan once, cache result)
+--       _baseCache["PlayerController"] = _findRoot(
+--         "48 8B 05 ?? ?? ?? ?? 48 85 C0 74 ?? 48 8B 40",
+--         {{0x18, 0x28}}  -- adjust chain to reach PlayerController instance
+--       )
+--     end
+--     return _baseCache["PlayerController"]
+--   end
+-- ─────────────────────────────────────────────────────────────────────────────
+"""
+
 
 class IL2CPPResolver(AbstractResolver):
     """Resolver for Unity IL2CPP games (AoT compiled)."""
@@ -69,20 +118,14 @@ class IL2CPPResolver(AbstractResolver):
             base_helper = f"_getBase_{cls.name}()"
 
             for fld in cls.fields:
-                if not fld.offset:
+                offset_int = fld.offset_int  # accepts both "0x58" and "58"
+                if offset_int is None:
                     continue  # no offset info → can't resolve
 
-                try:
-                    offset_int = int(fld.offset, 16) if fld.offset.startswith("0x") \
-                                 else int(fld.offset, 16)
-                except (ValueError, AttributeError):
-                    continue
+                read_fn  = _ce_read(fld.type)
+                write_fn = _ce_write(fld.type)
 
-                read_fn  = FieldResolution(cls.name, fld.name, fld.type,
-                                           ResolutionStrategy.IL2CPP_PTR).ce_read_fn()
-                write_fn = read_fn.replace("read", "write")
-
-                offset_hex = hex(offset_int)
+                offset_hex = f"{offset_int:#x}"
                 read_expr  = f"{read_fn}({base_helper} + {offset_hex})"
                 write_expr = f"{write_fn}({base_helper} + {offset_hex}, {{value}})"
 
@@ -111,50 +154,15 @@ class IL2CPPResolver(AbstractResolver):
         a template `_getBase_*` function the LLM must specialise.
         """
         module = context.module_name or "GameAssembly.dll"
-        ptr_size = _PTR_SIZE.get(context.bitness, 8)
-        return f"""\
--- ── IL2CPP pointer-chain helpers ─────────────────────────────────────────────
--- Module : {module}
--- Bitness: {context.bitness}-bit  (pointer size = {ptr_size} bytes)
---
--- Strategy: ONE root AOB per class → pointer chain → known field offset
--- Field offsets are static (AoT compilation) — no per-field AOB needed.
-
-local _baseCache = {{}}
-
--- Resolve a RIP-relative MOV instruction to its target address:
---   48 8B 05 [offset32]  →  next_instr_addr + offset32
-local function _resolveRIP(matchAddr)
-  local rel = readInteger(matchAddr + 3)    -- 4-byte signed offset
-  return (matchAddr + 7 + rel)              -- RIP = matchAddr + 7
-end
-
--- Generic AOB root finder: scans for pattern, resolves RIP pointer,
--- then walks an optional pointer chain.
--- chain: list of pointer offsets, e.g. {{0x20, 0x58}}
-local function _findRoot(aobPattern, chain)
-  local match = AOBScan(aobPattern, "{module}")
-  if not match then return nil end
-  local addr = readPointer(_resolveRIP(match))  -- dereference static ptr
-  for _, off in ipairs(chain or {{}}) do
-    if addr == 0 then return nil end
-    addr = readPointer(addr + off)
-  end
-  return addr
-end
-
--- TODO: Implement per-class base finders, using the AOB hint below.
--- Singleton pattern hint: "{_SINGLETON_AOB_HINT}"
--- Example:
---   local function _getBase_PlayerController()
---     if not _baseCache["PlayerController"] then
---       -- Find singleton root (scan once, cache result)
---       _baseCache["PlayerController"] = _findRoot(
---         "48 8B 05 ?? ?? ?? ?? 48 85 C0 74 ?? 48 8B 40",
---         {{0x18, 0x28}}  -- adjust chain to reach PlayerController instance
---       )
---     end
---     return _baseCache["PlayerController"]
---   end
--- ─────────────────────────────────────────────────────────────────────────────
-"""
+        return _render_preamble(module, context.bitness)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_preamble(module: str, bitness: int) -> str:
+    """Fill _PREAMBLE_TEMPLATE; the result only depends on (module, bitness)."""
+    return _PREAMBLE_TEMPLATE.format(
+        module=module,
+        bitness=bitness,
+        ptr_size=_PTR_SIZE.get(bitness, 8),
+        aob_hint=_SINGLETON_AOB_HINT,
+    )
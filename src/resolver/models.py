@@ -8,9 +8,10 @@ FieldResolution     — how to access ONE specific field at runtime
 EngineContext       — aggregated engine info passed to resolvers
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Any
 
 __all__ = [
     "ResolutionStrategy",
@@ -49,7 +50,7 @@ class ResolutionStrategy(str, Enum):
     AOB_WRITE   = "aob_write"
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldResolution:
     """
     Describes how to read/write ONE field at CE Lua runtime.
@@ -88,11 +89,11 @@ class FieldResolution:
 
     def ce_read_fn(self) -> str:
         """CE Lua read function name for this field's type."""
-        return _CE_READ.get(self.field_type.lower(), "readFloat")
+        return _ce_read(self.field_type)
 
     def ce_write_fn(self) -> str:
         """CE Lua write function name for this field's type."""
-        return _CE_WRITE.get(self.field_type.lower(), "writeFloat")
+        return _ce_write(self.field_type)
 
     def __str__(self) -> str:
         return (
@@ -114,11 +115,31 @@ _CE_READ = {
     "byte":    "readBytes",
     "bool":    "readBytes",
 }
-_CE_WRITE = {k: v.replace("read", "write") for k, v in _CE_READ.items()}
-_CE_WRITE["readBytes"] = "writeBytes"
+_CE_WRITE = {
+    "float":   "writeFloat",
+    "single":  "writeFloat",
+    "double":  "writeDouble",
+    "int32":   "writeInteger",
+    "int":     "writeInteger",
+    "uint32":  "writeInteger",
+    "int64":   "writeQword",
+    "int16":   "writeSmallInteger",
+    "byte":    "writeBytes",
+    "bool":    "writeBytes",
+}
+
+
+def _ce_read(field_type: str) -> str:
+    """CE Lua read function for *field_type* (resolvers call this per field)."""
+    return _CE_READ.get(field_type.lower(), "readFloat")
+
+
+def _ce_write(field_type: str) -> str:
+    """CE Lua write function for *field_type*."""
+    return _CE_WRITE.get(field_type.lower(), "writeFloat")
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineContext:
     """
     Enriched engine context passed to resolvers and PromptBuilder.
@@ -144,12 +165,9 @@ class EngineContext:
         Construct from a detector.EngineInfo object.
         `engine_info` is typed loosely to avoid a circular import.
         """
-        module = ""
         assembly = engine_info.extra.get("assembly_name", "Assembly-CSharp")
-        if engine_info.type.value == "Unity_IL2CPP":
-            module = "GameAssembly.dll"
-        elif engine_info.type.value in ("UE4", "UE5"):
-            module = engine_info.extra.get("primary_module", "")
+        module_fn = _ENGINE_MODULE_DEFAULTS.get(engine_info.type.value)
+        module = module_fn(engine_info) if module_fn else ""
         return cls(
             engine_type=engine_info.type.value,
             engine_version=engine_info.version,
@@ -158,3 +176,15 @@ class EngineContext:
             assembly_name=assembly,
             module_name=module,
         )
+
+
+def _ue_primary_module(engine_info: Any) -> str:
+    return engine_info.extra.get("primary_module", "")
+
+
+# EngineType value → EngineContext.module_name for that engine
+_ENGINE_MODULE_DEFAULTS: dict[str, Callable[[Any], str]] = {
+    "Unity_IL2CPP": lambda engine_info: "GameAssembly.dll",
+    "UE4":          _ue_primary_module,
+    "UE5":          _ue_primary_module,
+}
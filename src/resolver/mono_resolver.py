@@ -15,13 +15,14 @@ when it's not accessible via a known static field.
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.dumper.models import StructureJSON
 
 from .base import AbstractResolver
-from .models import EngineContext, FieldResolution, ResolutionStrategy
+from .models import EngineContext, FieldResolution, ResolutionStrategy, _ce_read, _ce_write
 
 __all__ = ["MonoResolver"]
 
@@ -29,6 +30,73 @@ __all__ = ["MonoResolver"]
 _SKIP_TYPES = {"UnityEngine.Transform", "GameObject", "Component",
                "Animator", "Rigidbody", "Collider"}
 
+# preamble_lua() body; str.format field: assembly
+_PREAMBLE_TEMPLATE = """\
+-- ── Mono runtime helpers ─────────────────────────────────────────────────────
+-- Assembly: {assembly}
+-- CE Mono bridge functions used: mono_findClass, mono_getClassField,
+--   mono_getFieldOffset, mono_object_get_field_address
+
+-- Bridge functions as locals: upvalue access instead of a global lookup per call
+local mono_findClass, mono_getClassField, mono_getFieldOffset =
+      mono_findClass, mono_getClassField, mono_getFieldOffset
+
+-- Nested caches indexed ns → class → field: lookups are plain table reads,
+-- no key strings are concatenated on the read/write path.  The `depth` outer
+-- levels are created on first access; misses aren't cached so a later call
+-- can retry.
+local function _autoTable(depth)
+  return setmetatable({{}}, {{__index = function(t, k)
+    local v = depth > 1 and _autoTable(depth - 1) or {{}}
+    t[k] = v
+    return v
+  end}})
+end
+local _classCache  = _autoTable(1)  -- [ns][name]            → class
+local _fieldCache  = _autoTable(2)  -- [ns][class][field]    → field descriptor
+local _offsetCache = _autoTable(2)  -- [ns][class][field]    → byte offset
+
+local function _monoClass(ns, name)
+  local byName = _classCache[ns]
+  local cls = byName[name]
+  if cls == nil then
+    cls = mono_findClass("{assembly}", ns, name)
+    byName[name] = cls
+  end
+  return cls
+end
+
+local function _monoField(ns, className, fieldName)
+  local byField = _fieldCache[ns][className]
+  local f = byField[fieldName]
+  if f == nil then
+    local cls = _monoClass(ns, className)
+    if cls then
+      f = mono_getClassField(cls, fieldName)
+      byField[fieldName] = f
+    end
+  end
+  return f
+end
+
+local function _monoOffset(ns, className, fieldName)
+  local byField = _offsetCache[ns][className]
+  local off = byField[fieldName]
+  if off == nil then
+    local f = _monoField(ns, className, fieldName)
+    off = f and mono_getFieldOffset(f) or nil
+    byField[fieldName] = off
+  end
+  return off
+end
+
+-- TODO: Implement per-class object finders, e.g.:
+--   function _getObj_PlayerController()
+--     return mono_findObject("{assembly}", "Game.Player", "PlayerController")
+--   end
+-- ─────────────────────────────────────────────────────────────────────────────
+"""
+
 
 class MonoResolver(AbstractResolver):
     """Resolver for Unity Mono games."""
@@ -48,46 +116,34 @@ class MonoResolver(AbstractResolver):
         For each class/field in the StructureJSON, emit a FieldResolution
         that uses `mono_findClass` + `mono_getFieldOffset`.
 
+        Instance fields whose offset the dumper already recorded are
+        constant-folded: the expression adds the literal offset instead of
+        calling `_monoOffset(...)` at runtime.
+
         The generated lua_write_expr references `_getObj_{class}()` — a
         per-class helper the LLM is expected to implement (typically by
         finding the MonoBehaviour instance via a static singleton or
         CE's `mono_findObject`).
         """
-        results: list[FieldResolution] = []
         assembly = context.assembly_name or "Assembly-CSharp"
-
-        for cls in structure.classes:
-            if not cls.fields:
-                continue
-
-            obj_helper = f"_getObj_{cls.name}()"
-
-            for fld in cls.fields:
-                if fld.type in _SKIP_TYPES:
-                    continue
-                if fld.is_static:
-                    # Static fields use mono_getStaticFieldValue
-                    read_expr, write_expr = self._static_exprs(
-                        assembly, cls.namespace, cls.name, fld.name, fld.type
-                    )
-                else:
-                    read_expr, write_expr = self._instance_exprs(
-                        assembly, cls.namespace, cls.name,
-                        fld.name, fld.type, obj_helper
-                    )
-
-                results.append(FieldResolution(
-                    class_name=cls.name,
-                    field_name=fld.name,
-                    field_type=fld.type,
-                    strategy=ResolutionStrategy.MONO_API,
-                    mono_assembly=assembly,
-                    mono_namespace=cls.namespace,
-                    lua_read_expr=read_expr,
-                    lua_write_expr=write_expr,
-                ))
-
-        return results
+        strategy = ResolutionStrategy.MONO_API
+        return [
+            FieldResolution(
+                class_name=cls.name,
+                field_name=fld.name,
+                field_type=fld.type,
+                strategy=strategy,
+                mono_assembly=assembly,
+                mono_namespace=cls.namespace,
+                field_offset=fld.offset_int or 0,
+                lua_read_expr=read_expr,
+                lua_write_expr=write_expr,
+            )
+            for cls in structure.classes
+            for fld in cls.fields
+            if fld.type not in _SKIP_TYPES
+            for read_expr, write_expr in (self._field_exprs(assembly, cls, fld),)
+        ]
 
     def preamble_lua(self, context: EngineContext) -> str:
         """
@@ -96,70 +152,48 @@ class MonoResolver(AbstractResolver):
         Provides `_monoField(cls, name)` and a pattern for per-class
         object finders.  The LLM must implement `_getObj_<ClassName>()`.
         """
-        assembly = context.assembly_name or "Assembly-CSharp"
-        return f"""\
--- ── Mono runtime helpers ─────────────────────────────────────────────────────
--- Assembly: {assembly}
--- CE Mono bridge functions used: mono_findClass, mono_getClassField,
---   mono_getFieldOffset, mono_object_get_field_address
-
-local _classCache = {{}}
-local _fieldCache  = {{}}
-
-local function _monoClass(ns, name)
-  local key = ns .. "." .. name
-  if not _classCache[key] then
-    _classCache[key] = mono_findClass("{assembly}", ns, name)
-  end
-  return _classCache[key]
-end
-
-local function _monoField(ns, className, fieldName)
-  local key = ns .. "." .. className .. ":" .. fieldName
-  if not _fieldCache[key] then
-    local cls = _monoClass(ns, className)
-    if cls then
-      _fieldCache[key] = mono_getClassField(cls, fieldName)
-    end
-  end
-  return _fieldCache[key]
-end
-
-local function _monoOffset(ns, className, fieldName)
-  local f = _monoField(ns, className, fieldName)
-  return f and mono_getFieldOffset(f) or nil
-end
-
--- TODO: Implement per-class object finders, e.g.:
---   function _getObj_PlayerController()
---     return mono_findObject("{assembly}", "Game.Player", "PlayerController")
---   end
--- ─────────────────────────────────────────────────────────────────────────────
-"""
+        return _render_preamble(context.assembly_name or "Assembly-CSharp")
 
     # ── Internal helpers ──────────────────────────────────────────────────
 
+    def _field_exprs(self, assembly: str, cls, fld) -> tuple[str, str]:
+        """(read_expr, write_expr) for one field of ClassInfo *cls*."""
+        if fld.is_static:
+            # Static fields use mono_getStaticFieldValue
+            return self._static_exprs(assembly, cls.namespace, cls.name, fld.name, fld.type)
+        return self._instance_exprs(
+            assembly, cls.namespace, cls.name, fld.name, fld.type,
+            f"_getObj_{cls.name}()", fld.offset_int,
+        )
+
     @staticmethod
     def _instance_exprs(
         assembly: str, ns: str, cls: str, field: str,
-        ftype: str, obj_helper: str,
+        ftype: str, obj_helper: str, offset: int | None = None,
     ) -> tuple[str, str]:
-        read_fn  = FieldResolution(cls, field, ftype, ResolutionStrategy.MONO_API).ce_read_fn()
-        write_fn = read_fn.replace("read", "write")
-
-        offset_call = f'_monoOffset("{ns}", "{cls}", "{field}")'
-        read_expr  = f'{read_fn}({obj_helper} + {offset_call})'
-        write_expr = f'{write_fn}({obj_helper} + {offset_call}, {{value}})'
-        return read_expr, write_expr
+        # "<obj> + <offset>" is shared by the read and write forms, so build it once;
+        # inline the dumped offset when known, else resolve it at runtime via _monoOffset
+        if offset:
+            addr = f"{obj_helper} + {offset:#x}"
+        else:
+            addr = "".join((obj_helper, ' + _monoOffset("', ns, '", "', cls, '", "', field, '")'))
+        return (
+            "".join((_ce_read(ftype), "(", addr, ")")),
+            "".join((_ce_write(ftype), "(", addr, ", {value})")),
+        )
 
     @staticmethod
     def _static_exprs(
         assembly: str, ns: str, cls: str, field: str, ftype: str
     ) -> tuple[str, str]:
-        read_fn  = FieldResolution(cls, field, ftype, ResolutionStrategy.MONO_API).ce_read_fn()
-        write_fn = read_fn.replace("read", "write")
-
         addr_expr = f'mono_getStaticFieldAddress(mono_getClassField(mono_findClass("{assembly}", "{ns}", "{cls}"), "{field}"))'
-        read_expr  = f'{read_fn}({addr_expr})'
-        write_expr = f'{write_fn}({addr_expr}, {{value}})'
-        return read_expr, write_expr
+        return (
+            "".join((_ce_read(ftype), "(", addr_expr, ")")),
+            "".join((_ce_write(ftype), "(", addr_expr, ", {value})")),
+        )
+
+
+@functools.lru_cache(maxsize=8)
+def _render_preamble(assembly: str) -> str:
+    """Fill _PREAMBLE_TEMPLATE; the result only depends on the assembly name."""
+    return _PREAMBLE_TEMPLATE.format(assembly=assembly)
@@ -14,13 +14,14 @@ not game-specific logic.
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.dumper.models import StructureJSON
 
 from .base import AbstractResolver
-from .models import EngineContext, FieldResolution, ResolutionStrategy
+from .models import EngineContext, FieldResolution, ResolutionStrategy, _ce_read, _ce_write
 
 __all__ = ["UnrealResolver"]
 
@@ -33,75 +34,16 @@ _GOBJECTS_AOB_UE5 = "48 89 05 ?? ?? ?? ?? E9"  # slightly different in UE5
 _UOB_CLASS_PRIVATE = 0x10   # UObjectBase::ClassPrivate
 _UOB_NAME_PRIVATE  = 0x18   # UObjectBase::NamePrivate (FName index)
 
-
-class UnrealResolver(AbstractResolver):
-    """Resolver for Unreal Engine 4/5 games."""
-
-    @property
-    def strategy(self) -> ResolutionStrategy:
-        return ResolutionStrategy.UE_GOBJECTS
-
-    # ── Public API ────────────────────────────────────────────────────────
-
-    def resolve(
-        self,
-        structure: "StructureJSON",
-        context: EngineContext,
-    ) -> list[FieldResolution]:
-        """
-        Emit one FieldResolution per class/field pair.
-
-        lua_write_expr references `_findActor("{class}")` — a helper
-        that walks GUObjectArray, provided in preamble_lua().
-        """
-        results: list[FieldResolution] = []
-
-        for cls in structure.classes:
-            if not cls.fields:
-                continue
-
-            actor_expr = f'_findActor("{cls.name}")'
-
-            for fld in cls.fields:
-                if not fld.offset:
-                    continue
-                try:
-                    offset_int = int(fld.offset, 16) if fld.offset.startswith("0x") \
-                                 else int(fld.offset, 16)
-                except (ValueError, AttributeError):
-                    continue
-
-                read_fn  = FieldResolution(cls.name, fld.name, fld.type,
-                                           ResolutionStrategy.UE_GOBJECTS).ce_read_fn()
-                write_fn = read_fn.replace("read", "write")
-
-                offset_hex = hex(offset_int)
-                read_expr  = f"{read_fn}({actor_expr} + {offset_hex})"
-                write_expr = f"{write_fn}({actor_expr} + {offset_hex}, {{value}})"
-
-                results.append(FieldResolution(
-                    class_name=cls.name,
-                    field_name=fld.name,
-                    field_type=fld.type,
-                    strategy=ResolutionStrategy.UE_GOBJECTS,
-                    ue_class_path=cls.name,
-                    lua_read_expr=read_expr,
-                    lua_write_expr=write_expr,
-                    notes=f"Property offset {offset_hex} from UE4SS dump.",
-                ))
-
-        return results
-
-    def preamble_lua(self, context: EngineContext) -> str:
-        """GUObjectArray scanner + FName reader + _findActor helper."""
-        is_ue5   = context.engine_type == "UE5"
-        gobjects_aob = _GOBJECTS_AOB_UE5 if is_ue5 else _GOBJECTS_AOB_UE4
-        engine_tag   = "UE5" if is_ue5 else "UE4"
-
-        return f"""\
+# preamble_lua() body; str.format fields: engine_tag, gobjects_aob,
+# class_private, name_private
+_PREAMBLE_TEMPLATE = """\
 -- ── Unreal Engine ({engine_tag}) — GUObjectArray helpers ────────────────────────
 -- GObjects AOB: {gobjects_aob}
--- UObjectBase offsets: ClassPrivate={hex(_UOB_CLASS_PRIVATE)}, NamePrivate={hex(_UOB_NAME_PRIVATE)}
+-- UObjectBase offsets: ClassPrivate={class_private:#x}, NamePrivate={name_private:#x}
+
+-- CE memory API as locals: upvalue access instead of a global lookup per call
+local readPointer, readInteger, readSmallInteger, readString, AOBScan =
+      readPointer, readInteger, readSmallInteger, readString, AOBScan
 
 local _GObjects   = nil
 local _GNames     = nil
@@ -131,32 +73,113 @@ local function _readFName(nameIndex)
   return readString(strPtr, len)
 end
 
--- Get class name of a UObject
-local function _getClassName(obj)
-  local classPtr = readPointer(obj + {hex(_UOB_CLASS_PRIVATE)})
-  if classPtr == 0 then return "" end
-  local nameIdx = readInteger(classPtr + {hex(_UOB_NAME_PRIVATE)})
-  return _readFName(nameIdx)
+-- FName index → string; each distinct name is read from GNames once
+-- (empty results aren't cached: _GNames may simply not be set up yet)
+local _nameCache = {{}}
+local function _fnameString(nameIdx)
+  local name = _nameCache[nameIdx]
+  if name == nil then
+    name = _readFName(nameIdx)
+    if name ~= "" then _nameCache[nameIdx] = name end
+  end
+  return name
 end
 
+-- FName index of a UObject's class (nil if it has no class)
+local function _getClassNameIndex(obj)
+  local classPtr = readPointer(obj + {class_private:#x})
+  if classPtr == 0 then return nil end
+  return readInteger(classPtr + {name_private:#x})
+end
+
+-- className → FName index, learned from the first object of that class
+local _classIdxCache = {{}}
+
 -- Walk GUObjectArray to find first object whose class name matches
 local function _findActor(className)
+  local cached = _actorCache[className]
+  if cached then return cached end
   _initGObjects()
   if not _GObjects then return 0 end
-  if _actorCache[className] then return _actorCache[className] end
 
-  local numObjs = readInteger(_GObjects + 0x14)
-  for i = 0, numObjs - 1 do
-    local entry = readPointer(_GObjects + 0x18 + i * 8)
+  -- Once the class's FName index is known the loop compares integers only
+  local target = _classIdxCache[className]
+  -- Step a slot pointer through the array instead of recomputing base + i * 8
+  local slot = _GObjects + 0x18
+  local last = slot + readInteger(_GObjects + 0x14) * 8
+  while slot < last do
+    local entry = readPointer(slot)
     if entry ~= 0 then
       local obj = readPointer(entry)
-      if obj ~= 0 and _getClassName(obj) == className then
+      local nameIdx = obj ~= 0 and _getClassNameIndex(obj)
+      if nameIdx and (nameIdx == target
+                      or (target == nil and _fnameString(nameIdx) == className)) then
+        _classIdxCache[className] = nameIdx
         _actorCache[className] = obj
         return obj
       end
     end
+    slot = slot + 8
   end
   return 0
 end
 -- ─────────────────────────────────────────────────────────────────────────────
 """
+
+
+class UnrealResolver(AbstractResolver):
+    """Resolver for Unreal Engine 4/5 games."""
+
+    @property
+    def strategy(self) -> ResolutionStrategy:
+        return ResolutionStrategy.UE_GOBJECTS
+
+    # ── Public API ────────────────────────────────────────────────────────
+
+    def resolve(
+        self,
+        structure: StructureJSON,
+        context: EngineContext,
+    ) -> list[FieldResolution]:
+        """
+        Emit one FieldResolution per class/field pair.
+
+        lua_write_expr references `_findActor("{class}")` — a helper
+        that walks GUObjectArray, provided in preamble_lua().
+        """
+        return [
+            self._field_resolution(cls.name, fld, offset_int)
+            for cls in structure.classes
+            for fld in cls.fields
+            if (offset_int := fld.offset_int) is not None
+        ]
+
+    @staticmethod
+    def _field_resolution(class_name: str, fld, offset_int: int) -> FieldResolution:
+        actor_expr = f'_findActor("{class_name}")'
+        offset_hex = f"{offset_int:#x}"
+        return FieldResolution(
+            class_name=class_name,
+            field_name=fld.name,
+            field_type=fld.type,
+            strategy=ResolutionStrategy.UE_GOBJECTS,
+            ue_class_path=class_name,
+            lua_read_expr=f"{_ce_read(fld.type)}({actor_expr} + {offset_hex})",
+            lua_write_expr=f"{_ce_write(fld.type)}({actor_expr} + {offset_hex}, {{value}})",
+            notes=f"Property offset {offset_hex} from UE4SS dump.",
+        )
+
+    def preamble_lua(self, context: EngineContext) -> str:
+        """GUObjectArray scanner + FName reader + _findActor helper."""
+        return _render_preamble(context.engine_type == "UE5")
+
+
+@functools.lru_cache(maxsize=2)
+def _render_preamble(is_ue5: bool) -> str:
+    """Fill _PREAMBLE_TEMPLATE; the result only depends on UE4 vs UE5."""
+    return _PREAMBLE_TEMPLATE.format(
+        engine_tag="UE5" if is_ue5 else "UE4",
+        gobjects_aob=_GOBJECTS_AOB_UE5 if is_ue5 else _GOBJECTS_AOB_UE4,
+        class_private=_UOB_CLASS_PRIVATE,
+        name_private=_UOB_NAME_PRIVATE,
+    )
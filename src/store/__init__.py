@@ -5,9 +5,18 @@ Public API
 ──────────
 ScriptRecord  — dataclass representing one cached script
 ScriptStore   — CRUD interface (save, get, search, invalidate, …)
+
+ScriptStore is exported lazily, so importing the package (or
+src.store.models alone) does not load sqlite3 until a store is needed.
 """
 
 from src.store.models import ScriptRecord
-from src.store.db import ScriptStore
 
 __all__ = ["ScriptRecord", "ScriptStore"]
+
+
+def __getattr__(name: str):
+    if name == "ScriptStore":
+        from src.store.db import ScriptStore
+        return ScriptStore
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
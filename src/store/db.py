@@ -23,9 +23,13 @@ Usage::
 
 import logging
 import sqlite3
-from datetime import datetime, timezone
+import threading
+import time
+import zlib
+from collections.abc import Iterable
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Optional
 
 from src.store.models import ScriptRecord
 
@@ -35,6 +39,120 @@ logger = logging.getLogger(__name__)
 
 # Path to the SQL schema file bundled with this package
 _SCHEMA_PATH = Path(__file__).parent / "migrations" / "schema.sql"
+# Optional FTS5 index for search(); skipped if SQLite lacks FTS5
+_FTS_SCHEMA_PATH = Path(__file__).parent / "migrations" / "fts.sql"
+# Read once at import; every ScriptStore applies the same DDL
+_SCHEMA_SQL = _SCHEMA_PATH.read_text(encoding="utf-8")
+_FTS_SCHEMA_SQL = _FTS_SCHEMA_PATH.read_text(encoding="utf-8")
+
+# Applied once when the store's connection is opened
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-8000",
+)
+
+# Fixed statements, kept as constants so sqlite3's statement cache reuses them
+_SQL_SAVE = """
+    INSERT INTO scripts
+        (game_hash, game_name, engine_type, feature,
+         lua_script, aob_sigs, created_at,
+         success_count, fail_count)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(game_hash, feature) DO UPDATE SET
+        game_name   = excluded.game_name,
+        engine_type = excluded.engine_type,
+        lua_script  = excluded.lua_script,
+        aob_sigs    = excluded.aob_sigs
+    RETURNING id
+"""
+_SQL_GET = "SELECT * FROM scripts WHERE game_hash=? AND feature=?"
+_SQL_SUCCESS = (
+    "UPDATE scripts SET success_count = success_count + 1, last_used=? WHERE id=?"
+)
+_SQL_FAILURE = "UPDATE scripts SET fail_count = fail_count + 1 WHERE id=?"
+_SQL_INVALIDATE = "DELETE FROM scripts WHERE game_hash=?"
+_SQL_DELETE = "DELETE FROM scripts WHERE id=?"
+
+# One-off rewrite of a pre-epoch database (created_at/last_used stored as
+# ISO-8601 TEXT) into the current schema; ids, and so the FTS index, are kept.
+# The schema runs twice: first to create the new table (its index names are
+# still taken by the old table), then to recreate the indexes once it's gone.
+_SQL_MIGRATE_EPOCH = (
+    "BEGIN IMMEDIATE;\n"
+    "ALTER TABLE scripts RENAME TO scripts_v0;\n"
+    + _SCHEMA_SQL
+    + """
+    INSERT INTO scripts
+        (id, game_hash, game_name, engine_type, feature, lua_script, aob_sigs,
+         created_at, last_used, success_count, fail_count)
+    SELECT id, game_hash, game_name, engine_type, feature, lua_script, aob_sigs,
+           COALESCE(CAST(strftime('%s', created_at) AS INTEGER),
+                    CAST(strftime('%s', 'now') AS INTEGER)),
+           CAST(strftime('%s', last_used) AS INTEGER),
+           success_count, fail_count
+    FROM scripts_v0;
+    DROP TABLE scripts_v0;
+    """
+    + _SCHEMA_SQL
+    + "COMMIT;\n"
+)
+
+# lua_script / aob_sigs values at least this long (in characters) are stored
+# zlib-compressed as BLOBs; shorter ones stay plain TEXT
+_COMPRESS_MIN_CHARS = 256
+_ZLIB_LEVEL = 6
+
+# (game_hash, feature) pairs per get_many() statement; 2 bound parameters each,
+# well under SQLite's host-parameter limit
+_GET_MANY_BATCH = 400
+
+
+def _epoch(dt: datetime) -> int:
+    """Unix seconds for *dt*; naive datetimes are taken to be UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return int(dt.timestamp())
+
+
+def _to_datetime(value) -> datetime | None:
+    """Stored timestamp (epoch seconds, or NULL) → aware UTC datetime."""
+    if value is None:
+        return None
+    if isinstance(value, int):
+        return datetime.fromtimestamp(value, tz=UTC)
+    # Pre-migration ISO-8601 text (not expected once migrated)
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _pack_text(text: str | None) -> str | bytes | None:
+    """Column value for *text*: compressed bytes if long enough to pay off."""
+    if text is None or len(text) < _COMPRESS_MIN_CHARS:
+        return text
+    return zlib.compress(text.encode("utf-8"), _ZLIB_LEVEL)
+
+
+def _unpack_text(value: str | bytes) -> str:
+    """Inverse of _pack_text; plain TEXT (incl. rows written before) passes through."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value).decode("utf-8")
+    return value
+
+
+def _fts_query(text: str) -> str:
+    """
+    Turn free text into an FTS5 MATCH expression on game_name.
+
+    Each whitespace-separated term becomes a quoted prefix query, so
+    "hollow kni" matches "Hollow Knight"; terms are ANDed.
+    """
+    terms = " ".join('"' + t.replace('"', '""') + '"*' for t in text.split())
+    return f"game_name : ({terms})"
 
 
 class ScriptStore:
@@ -42,50 +160,124 @@ class ScriptStore:
     CRUD interface for the local SQLite script cache.
 
     The database file and schema are created automatically on first open.
-    All operations use context-managed connections; no persistent connection
-    is kept open between calls (safe for single-process use on all platforms).
+    One connection is opened per store and reused by every call, so lookups
+    don't pay for connect + PRAGMAs each time.  Calls are serialised with a
+    lock, which makes a store safe to share between the GUI and worker
+    threads.  Call close() (or use the store as a context manager) when done.
+
+    Pass ``":memory:"`` as *db_path* for a private in-memory store that lives
+    as long as the ScriptStore instance (handy for tests).
     """
 
     def __init__(self, db_path: str) -> None:
         self._db_path = Path(db_path).expanduser()
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fts = False
+        self._lock = threading.RLock()
+        # Autocommit mode: writes issue their own BEGIN IMMEDIATE / COMMIT
+        self._conn = sqlite3.connect(
+            str(self._db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
         self._ensure_schema()
 
+    def close(self) -> None:
+        """Close the underlying connection; the store is unusable afterwards."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "ScriptStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     # ── Internal helpers ──────────────────────────────────────────────────
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA foreign_keys=ON")
-        return conn
+    @contextmanager
+    def _write(self):
+        """Run the enclosed statements in one IMMEDIATE transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _query(self, sql: str, params: tuple = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
 
     def _ensure_schema(self) -> None:
-        """Create tables if they don't already exist."""
-        sql = _SCHEMA_PATH.read_text(encoding="utf-8")
-        with self._connect() as conn:
-            conn.executescript(sql)
+        """Create tables (and the FTS5 index, when available) if missing."""
+        conn = self._conn
+        conn.executescript(_SCHEMA_SQL)
+        (created_type,) = conn.execute(
+            "SELECT type FROM pragma_table_info('scripts') WHERE name='created_at'"
+        ).fetchone()
+        if created_type.upper() == "TEXT":
+            logger.info("Migrating %s to epoch timestamps", self._db_path)
+            try:
+                conn.executescript(_SQL_MIGRATE_EPOCH)
+            except sqlite3.Error:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        had_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='scripts_fts'"
+        ).fetchone() is not None
+        try:
+            conn.executescript(_FTS_SCHEMA_SQL)
+        except sqlite3.OperationalError as exc:
+            logger.info("FTS5 unavailable, search() falls back to LIKE: %s", exc)
+            return
+        if not had_fts:
+            # First index build on an existing database: backfill its rows
+            conn.execute("INSERT INTO scripts_fts(scripts_fts) VALUES ('rebuild')")
+        self._fts = True
+
+    def _name_filter(self, game_name: str) -> tuple[str, tuple]:
+        """WHERE clause and parameters selecting rows matching *game_name*."""
+        if not game_name.strip():
+            return "", ()
+        if self._fts:
+            return (
+                " WHERE id IN (SELECT rowid FROM scripts_fts WHERE scripts_fts MATCH ?)",
+                (_fts_query(game_name),),
+            )
+        return " WHERE game_name LIKE ?", (f"%{game_name}%",)
 
     @staticmethod
-    def _row_to_record(row: sqlite3.Row) -> ScriptRecord:
-        def _dt(s: Optional[str]) -> Optional[datetime]:
-            if not s:
-                return None
-            try:
-                return datetime.fromisoformat(s.replace("Z", "+00:00"))
-            except ValueError:
-                return None
+    def _save_params(record: ScriptRecord) -> tuple:
+        """Bound parameters of _SQL_SAVE for *record*."""
+        return (
+            record.game_hash,
+            record.game_name,
+            record.engine_type,
+            record.feature,
+            _pack_text(record.lua_script),
+            _pack_text(record.aob_sigs),
+            _epoch(record.created_at) if record.created_at else int(time.time()),
+            record.success_count,
+            record.fail_count,
+        )
 
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> ScriptRecord:
         return ScriptRecord(
             id=row["id"],
             game_hash=row["game_hash"],
             game_name=row["game_name"],
             engine_type=row["engine_type"],
             feature=row["feature"],
-            lua_script=row["lua_script"],
-            aob_sigs=row["aob_sigs"],
-            created_at=_dt(row["created_at"]),
-            last_used=_dt(row["last_used"]),
+            lua_script=_unpack_text(row["lua_script"]),
+            aob_sigs=_unpack_text(row["aob_sigs"]),
+            created_at=_to_datetime(row["created_at"]),
+            last_used=_to_datetime(row["last_used"]),
             success_count=row["success_count"],
             fail_count=row["fail_count"],
         )
@@ -96,73 +288,81 @@ class ScriptStore:
         """
         Persist *record* to the database.
 
-        Uses INSERT OR REPLACE so that duplicate (game_hash, feature) pairs
-        are silently updated rather than raising a constraint error.
+        An existing (game_hash, feature) row is updated in place: the
+        script, AOB signatures, game name and engine type are replaced,
+        while its id, created_at and success/fail counters are kept.
 
         Returns:
-            The SQLite rowid of the newly inserted (or replaced) row.
+            The id of the inserted or updated row.
         """
-        created = (
-            record.created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-            if record.created_at
-            else datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        )
-        with self._connect() as conn:
-            cur = conn.execute(
-                """
-                INSERT OR REPLACE INTO scripts
-                    (game_hash, game_name, engine_type, feature,
-                     lua_script, aob_sigs, created_at,
-                     success_count, fail_count)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.game_hash,
-                    record.game_name,
-                    record.engine_type,
-                    record.feature,
-                    record.lua_script,
-                    record.aob_sigs,
-                    created,
-                    record.success_count,
-                    record.fail_count,
-                ),
-            )
-            conn.commit()
-            return cur.lastrowid  # type: ignore[return-value]
+        with self._write() as conn:
+            ((row_id,),) = conn.execute(_SQL_SAVE, self._save_params(record)).fetchall()
+        return row_id
+
+    def save_many(self, records: Iterable[ScriptRecord]) -> list[int]:
+        """
+        Persist several records in one transaction (one commit for the batch).
+
+        Same per-record semantics as :meth:`save`; if any record fails,
+        none of the batch is written.
 
-    def get(self, game_hash: str, feature: str) -> Optional[ScriptRecord]:
+        Returns:
+            The row ids, in the order of *records*.
+        """
+        ids: list[int] = []
+        with self._write() as conn:
+            # RETURNING does not work with executemany, so run per row; the statement
+            # is cached and the batch commits once
+            for record in records:
+                ((row_id,),) = conn.execute(_SQL_SAVE, self._save_params(record)).fetchall()
+                ids.append(row_id)
+        return ids
+
+    def get(self, game_hash: str, feature: str) -> ScriptRecord | None:
         """
         Retrieve a cached script by (game_hash, feature).
 
         Returns:
             ScriptRecord if found, None on cache miss.
         """
-        with self._connect() as conn:
-            row = conn.execute(
-                "SELECT * FROM scripts WHERE game_hash=? AND feature=?",
-                (game_hash, feature),
-            ).fetchone()
-        return self._row_to_record(row) if row else None
+        rows = self._query(_SQL_GET, (game_hash, feature))
+        return self._row_to_record(rows[0]) if rows else None
+
+    def get_many(
+        self, pairs: Iterable[tuple[str, str]]
+    ) -> dict[tuple[str, str], ScriptRecord]:
+        """
+        Retrieve several cached scripts by (game_hash, feature) in one query.
+
+        Returns:
+            Mapping of each pair found to its ScriptRecord; misses are absent.
+        """
+        keys = list(dict.fromkeys(pairs))
+        found: dict[tuple[str, str], ScriptRecord] = {}
+        for start in range(0, len(keys), _GET_MANY_BATCH):
+            batch = keys[start:start + _GET_MANY_BATCH]
+            values = ",".join(["(?,?)"] * len(batch))
+            # Join a CTE rather than (a, b) IN (VALUES …): the latter scans the whole
+            # table, the join can use the unique index
+            sql = (
+                f"WITH k(h, f) AS (VALUES {values}) "
+                "SELECT s.* FROM k JOIN scripts s ON s.game_hash = k.h AND s.feature = k.f"
+            )
+            params = tuple(v for pair in batch for v in pair)
+            for row in self._query(sql, params):
+                found[(row["game_hash"], row["feature"])] = self._row_to_record(row)
+        return found
 
     def record_success(self, record_id: int) -> None:
         """Increment success_count and update last_used for *record_id*."""
-        now = datetime.now(tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        with self._connect() as conn:
-            conn.execute(
-                "UPDATE scripts SET success_count = success_count + 1, last_used=? WHERE id=?",
-                (now, record_id),
-            )
-            conn.commit()
+        now = int(time.time())
+        with self._write() as conn:
+            conn.execute(_SQL_SUCCESS, (now, record_id))
 
     def record_failure(self, record_id: int) -> None:
         """Increment fail_count for *record_id*."""
-        with self._connect() as conn:
-            conn.execute(
-                "UPDATE scripts SET fail_count = fail_count + 1 WHERE id=?",
-                (record_id,),
-            )
-            conn.commit()
+        with self._write() as conn:
+            conn.execute(_SQL_FAILURE, (record_id,))
 
     def invalidate(self, game_hash: str) -> int:
         """
@@ -171,31 +371,44 @@ class ScriptStore:
         Returns:
             Number of rows deleted.
         """
-        with self._connect() as conn:
-            cur = conn.execute(
-                "DELETE FROM scripts WHERE game_hash=?", (game_hash,)
-            )
-            conn.commit()
-            return cur.rowcount
-
-    def search(self, game_name: str = "") -> list[ScriptRecord]:
+        with self._write() as conn:
+            return conn.execute(_SQL_INVALIDATE, (game_hash,)).rowcount
+
+    def search(
+        self,
+        game_name: str = "",
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[ScriptRecord]:
         """
-        Search cached scripts by game name substring.
+        Search cached scripts by game name.
+
+        Uses the FTS5 index when available: every word of *game_name* must
+        prefix a word of the stored name (ScriptManagerViewModel filters
+        loaded records the same way).  Without FTS5 it falls back to a
+        broader LIKE substring match.
 
         Args:
-            game_name: Substring to match (case-insensitive).
+            game_name: Words to match (case-insensitive).
                        Empty string returns all records.
+            limit:     Maximum number of records to return (None = all).
+            offset:    Number of matching records to skip, for windowed reads.
 
         Returns:
-            List of matching ScriptRecord objects.
+            List of matching ScriptRecord objects, newest first.
         """
-        pattern = f"%{game_name}%"
-        with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT * FROM scripts WHERE game_name LIKE ? ORDER BY created_at DESC",
-                (pattern,),
-            ).fetchall()
-        return [self._row_to_record(r) for r in rows]
+        where, params = self._name_filter(game_name)
+        sql = f"SELECT * FROM scripts{where} ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += (limit, offset)
+        return [self._row_to_record(r) for r in self._query(sql, params)]
+
+    def count(self, game_name: str = "") -> int:
+        """Number of records search(*game_name*) would return."""
+        where, params = self._name_filter(game_name)
+        ((n,),) = self._query(f"SELECT COUNT(*) FROM scripts{where}", params)
+        return n
 
     def delete(self, record_id: int) -> bool:
         """
@@ -204,7 +417,5 @@ class ScriptStore:
         Returns:
             True if a row was deleted, False if id not found.
         """
-        with self._connect() as conn:
-            cur = conn.execute("DELETE FROM scripts WHERE id=?", (record_id,))
-            conn.commit()
-            return cur.rowcount > 0
+        with self._write() as conn:
+            return conn.execute(_SQL_DELETE, (record_id,)).rowcount > 0
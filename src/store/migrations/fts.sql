@@ -0,0 +1,24 @@
+-- Full-text index over scripts(game_name, feature) used by ScriptStore.search.
+-- External-content FTS5 table kept in sync by triggers; applied after
+-- schema.sql when the SQLite build includes FTS5.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS scripts_fts USING fts5(
+    game_name, feature, content='scripts', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS scripts_fts_ai AFTER INSERT ON scripts BEGIN
+    INSERT INTO scripts_fts(rowid, game_name, feature)
+    VALUES (new.id, new.game_name, new.feature);
+END;
+
+CREATE TRIGGER IF NOT EXISTS scripts_fts_ad AFTER DELETE ON scripts BEGIN
+    INSERT INTO scripts_fts(scripts_fts, rowid, game_name, feature)
+    VALUES ('delete', old.id, old.game_name, old.feature);
+END;
+
+CREATE TRIGGER IF NOT EXISTS scripts_fts_au AFTER UPDATE ON scripts BEGIN
+    INSERT INTO scripts_fts(scripts_fts, rowid, game_name, feature)
+    VALUES ('delete', old.id, old.game_name, old.feature);
+    INSERT INTO scripts_fts(rowid, game_name, feature)
+    VALUES (new.id, new.game_name, new.feature);
+END;
@@ -9,8 +9,8 @@ CREATE TABLE IF NOT EXISTS scripts (
     feature       TEXT    NOT NULL,
     lua_script    TEXT    NOT NULL,
     aob_sigs      TEXT    NOT NULL DEFAULT '[]',
-    created_at    TEXT    NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now')),
-    last_used     TEXT,
+    created_at    INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),  -- Unix epoch seconds (UTC)
+    last_used     INTEGER,                                                            -- Unix epoch seconds, or NULL
     success_count INTEGER NOT NULL DEFAULT 0,
     fail_count    INTEGER NOT NULL DEFAULT 0,
     UNIQUE(game_hash, feature)
@@ -18,3 +18,5 @@ CREATE TABLE IF NOT EXISTS scripts (
 
 CREATE INDEX IF NOT EXISTS idx_game_hash ON scripts(game_hash);
 CREATE INDEX IF NOT EXISTS idx_game_name ON scripts(game_name);
+-- Newest-first listing (search() ORDER BY) walks this index instead of sorting
+CREATE INDEX IF NOT EXISTS idx_created_at ON scripts(created_at DESC, id DESC);
@@ -7,7 +7,7 @@ from typing import Optional
 __all__ = ["ScriptRecord"]
 
 
-@dataclass
+@dataclass(slots=True)
 class ScriptRecord:
     """
     Persistent record of a generated CE Lua script.
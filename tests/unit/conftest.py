@@ -0,0 +1,159 @@
+"""
+Shared fixtures for the unit test suite.
+
+The analyzer fixtures below are session-scoped: they build plain dataclass
+values (or stateless helpers) that no test mutates, so one instance is
+shared by every test.
+"""
+
+import pytest
+
+from src.analyzer.llm_analyzer import LLMAnalyzer, LLMConfig
+from src.analyzer.models import (
+    AOBSignature,
+    FeatureType,
+    GeneratedScript,
+    TrainerFeature,
+)
+from src.analyzer.prompts.builder import PromptBuilder
+from src.analyzer.validator import ScriptValidator
+from src.dumper.models import ClassInfo, FieldInfo, StructureJSON
+from src.resolver.models import EngineContext
+
+# A minimal but syntactically plausible generated script
+_STUB_LUA = """\
+local cheatEnabled = false
+
+local function applyCheat()
+  local addr = AOBScan("89 87 ?? ?? 00 00 F3 0F 11")
+  if addr then
+    writeFloat(addr + 0x58, 9999.0)
+  end
+end
+
+local function toggle()
+  cheatEnabled = not cheatEnabled
+  if cheatEnabled then applyCheat() end
+end
+
+registerHotkey(0x70, toggle)
+"""
+
+
+# ── Guards ────────────────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="session", autouse=True)
+def _no_luac():
+    """Never spawn `luac` from unit tests, even via a default ScriptValidator()."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ScriptValidator, "_check_lua_syntax", staticmethod(lambda lua_code: None))
+        yield
+
+
+# ── Analyzer fixtures ─────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def simple_structure() -> StructureJSON:
+    return StructureJSON(
+        engine="Unity_IL2CPP",
+        version="2022.3.10",
+        classes=[
+            ClassInfo(
+                name="PlayerController",
+                namespace="Game.Player",
+                parent_class="MonoBehaviour",
+                fields=[
+                    FieldInfo(name="health",    type="float",  offset="0x58"),
+                    FieldInfo(name="maxHealth", type="float",  offset="0x5C"),
+                    FieldInfo(name="gold",      type="int32",  offset="0x64"),
+                ],
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def health_feature() -> TrainerFeature:
+    return TrainerFeature(
+        name="Infinite Health",
+        feature_type=FeatureType.INFINITE_HEALTH,
+        hotkey="F1",
+    )
+
+
+@pytest.fixture(scope="session")
+def valid_aob() -> AOBSignature:
+    return AOBSignature(
+        pattern="89 87 ?? ?? 00 00 F3 0F 11",
+        offset=0,
+        module="GameAssembly.dll",
+        description="health write",
+    )
+
+
+@pytest.fixture(scope="session")
+def stub_script(health_feature, valid_aob) -> GeneratedScript:
+    return GeneratedScript(
+        lua_code=_STUB_LUA,
+        feature=health_feature,
+        aob_sigs=[valid_aob],
+        model_id="stub-v1",
+    )
+
+
+@pytest.fixture(scope="session")
+def validator() -> ScriptValidator:
+    return ScriptValidator(use_luac=False)
+
+
+@pytest.fixture(scope="session")
+def prompt_builder() -> PromptBuilder:
+    return PromptBuilder()
+
+
+@pytest.fixture(scope="session")
+def stub_analyzer() -> LLMAnalyzer:
+    return LLMAnalyzer(LLMConfig(backend="stub"))
+
+
+# ── Factory fixtures ──────────────────────────────────────────────────────────
+# Each returns a builder callable; tests pass overrides for the bits they vary.
+
+@pytest.fixture(scope="session")
+def make_feature():
+    def _make(name: str = "Infinite Health", hotkey: str = "F1") -> TrainerFeature:
+        return TrainerFeature(
+            name=name,
+            feature_type=FeatureType.INFINITE_HEALTH,
+            hotkey=hotkey,
+        )
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_aob():
+    def _make(pattern: str = "48 8B 05 ?? ?? ?? ??") -> AOBSignature:
+        return AOBSignature(pattern=pattern, offset=0, module="game.exe")
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_script(make_feature, make_aob):
+    def _make(
+        lua_code: str = "-- stub\nwriteFloat(0x1000, 9999)",
+        aob_sigs: list | None = None,
+        feature: TrainerFeature | None = None,
+    ) -> GeneratedScript:
+        return GeneratedScript(
+            lua_code=lua_code,
+            feature=feature or make_feature(),
+            aob_sigs=aob_sigs if aob_sigs is not None else [make_aob()],
+        )
+    return _make
+
+
+@pytest.fixture(scope="session")
+def make_engine_ctx():
+    def _make(engine_type: str = "Unity_Mono") -> EngineContext:
+        return EngineContext(engine_type=engine_type, engine_version="2022.3.10", bitness=64)
+    return _make
@@ -10,29 +10,50 @@ export cmd    → 1 test   (bad ID raises SystemExit / error)
 Total         = 8 new tests
 """
 
+import functools
+import os
+import struct
 import sys
 from io import StringIO
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.analyzer.models import FeatureType, GeneratedScript, TrainerFeature
+from src.cli.main import (
+    _parse_feature_type,
+    build_parser,
+    cmd_export,
+    cmd_generate,
+    cmd_list,
+    main,
+)
+from src.detector.models import EngineInfo, EngineType
+from src.dumper.models import ClassInfo, FieldInfo, StructureJSON
+from src.store.db import ScriptStore
+from src.store.models import ScriptRecord
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+@functools.lru_cache(maxsize=1)
+def _parser():
+    """The CLI argument parser, built once; parse_args() leaves it unchanged."""
+    return build_parser()
+
+
 def _parse(args: list[str]):
     """Call the CLI argument parser and return the parsed namespace."""
-    from src.cli.main import build_parser
-    parser = build_parser()
-    return parser.parse_args(args)
+    return _parser().parse_args(args)
 
 
 @pytest.fixture
-def store(tmp_path):
-    """Fresh ScriptStore for CLI command tests."""
-    from src.store.db import ScriptStore
-    return ScriptStore(db_path=str(tmp_path / "cli_test.db"))
+def store():
+    """Fresh in-memory ScriptStore for CLI command tests."""
+    with ScriptStore(db_path=":memory:") as s:
+        yield s
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -74,14 +95,11 @@ class TestArgParsing:
 class TestListCommand:
 
     def test_list_empty_store_outputs_zero_records(self, store, capsys):
-        from src.cli.main import cmd_list
         cmd_list(store=store, game=None)
         captured = capsys.readouterr()
         assert "0" in captured.out or "no" in captured.out.lower() or captured.out.strip() == ""
 
     def test_list_with_records_prints_game_name(self, store, capsys):
-        from src.store.models import ScriptRecord
-        from src.cli.main import cmd_list
         store.save(ScriptRecord(
             game_hash="h1", game_name="Hollow Knight",
             engine_type="Unity_Mono", feature="inf_hp", lua_script="--",
@@ -98,7 +116,6 @@ class TestListCommand:
 class TestExportCommand:
 
     def test_export_invalid_id_raises(self, store, tmp_path):
-        from src.cli.main import cmd_export
         with pytest.raises((ValueError, SystemExit, KeyError)):
             cmd_export(store=store, record_id=9999, fmt="ct",
                        output_dir=str(tmp_path))
@@ -114,7 +131,6 @@ class TestGenerateCommand:
     @pytest.fixture
     def fake_il2cpp_exe(self, tmp_path):
         """64-bit PE with GameAssembly.dll → UNITY_IL2CPP detection."""
-        import struct
         exe = tmp_path / "Game.exe"
         dos = b"MZ" + b"\x00" * 0x3A + struct.pack("<I", 0x40)
         pe  = b"PE\x00\x00" + struct.pack("<H", 0x8664)
@@ -124,7 +140,6 @@ class TestGenerateCommand:
 
     @pytest.fixture
     def fake_structure(self):
-        from src.dumper.models import StructureJSON, ClassInfo, FieldInfo
         return StructureJSON(
             engine="Unity_IL2CPP",
             version="2022.3",
@@ -138,8 +153,6 @@ class TestGenerateCommand:
 
     def test_generate_creates_lua_file(self, store, fake_il2cpp_exe, fake_structure, tmp_path):
         """Happy path: generates .lua file in output dir."""
-        from unittest.mock import patch, MagicMock
-        from src.cli.main import cmd_generate
 
         with patch("src.cli.main.get_dumper") as mock_gd:
             mock_dumper = MagicMock()
@@ -161,8 +174,6 @@ class TestGenerateCommand:
 
     def test_generate_saves_to_cache(self, store, fake_il2cpp_exe, fake_structure, tmp_path):
         """After generation, record should be retrievable from store."""
-        from unittest.mock import patch, MagicMock
-        from src.cli.main import cmd_generate
 
         with patch("src.cli.main.get_dumper") as mock_gd:
             mock_dumper = MagicMock()
@@ -178,8 +189,6 @@ class TestGenerateCommand:
 
     def test_generate_cache_hit_skips_dumper(self, store, fake_il2cpp_exe, fake_structure, tmp_path):
         """Second call with same args hits cache — dumper.dump() not called again."""
-        from unittest.mock import patch, MagicMock
-        from src.cli.main import cmd_generate
 
         with patch("src.cli.main.get_dumper") as mock_gd:
             mock_dumper = MagicMock()
@@ -195,8 +204,6 @@ class TestGenerateCommand:
 
     def test_generate_no_cache_forces_redump(self, store, fake_il2cpp_exe, fake_structure, tmp_path):
         """--no-cache always calls dumper even on cache hit."""
-        from unittest.mock import patch, MagicMock
-        from src.cli.main import cmd_generate
 
         with patch("src.cli.main.get_dumper") as mock_gd:
             mock_dumper = MagicMock()
@@ -212,9 +219,6 @@ class TestGenerateCommand:
 
     def test_main_generate_returns_0(self, tmp_path, fake_structure):
         """main() returns exit code 0 on successful generation."""
-        import struct
-        from unittest.mock import patch, MagicMock
-        from src.cli.main import main
 
         exe = tmp_path / "Game.exe"
         dos = b"MZ" + b"\x00" * 0x3A + struct.pack("<I", 0x40)
@@ -244,26 +248,19 @@ class TestGenerateCommand:
         assert rc == 0
 
     def test_parse_feature_type_known(self):
-        from src.cli.main import _parse_feature_type
-        from src.analyzer.models import FeatureType
         assert _parse_feature_type("infinite_health") == FeatureType.INFINITE_HEALTH
 
     def test_parse_feature_type_unknown_returns_custom(self):
-        from src.cli.main import _parse_feature_type
-        from src.analyzer.models import FeatureType
         assert _parse_feature_type("fly_mode") == FeatureType.CUSTOM
 
     @pytest.fixture
     def fake_script(self):
-        from src.analyzer.models import GeneratedScript, TrainerFeature, FeatureType
         feature = TrainerFeature(name="infinite_health", feature_type=FeatureType.INFINITE_HEALTH)
         return GeneratedScript(lua_code="-- stub lua\nprint('health')", feature=feature)
 
     @staticmethod
     def _make_engine_info(exe_path: str):
         """Build a minimal EngineInfo for test use."""
-        import os
-        from src.detector.models import EngineInfo, EngineType
         return EngineInfo(
             type=EngineType.UNITY_IL2CPP,
             version="2022.3",
@@ -274,9 +271,6 @@ class TestGenerateCommand:
 
     def test_progress_cb_none_does_not_raise(self, fake_il2cpp_exe, fake_structure, fake_script, tmp_path):
         """cmd_generate with progress_cb=None (default) runs without error."""
-        from unittest.mock import patch
-        from src.cli.main import cmd_generate
-        from src.store.db import ScriptStore
 
         store = ScriptStore(str(tmp_path / "s.db"))
 
@@ -300,9 +294,6 @@ class TestGenerateCommand:
 
     def test_progress_cb_called_at_each_step(self, fake_il2cpp_exe, fake_structure, fake_script, tmp_path):
         """progress_cb is invoked multiple times with non-decreasing pct."""
-        from unittest.mock import patch
-        from src.cli.main import cmd_generate
-        from src.store.db import ScriptStore
 
         store = ScriptStore(str(tmp_path / "s.db"))
         calls: list = []
@@ -331,10 +322,6 @@ class TestGenerateCommand:
 
     def test_progress_cb_final_value_is_1(self, fake_il2cpp_exe, fake_structure, fake_script, tmp_path):
         """The last progress_cb call always has pct == 1.0."""
-        from unittest.mock import patch
-        from src.cli.main import cmd_generate
-        from src.store.db import ScriptStore
-        import pytest
 
         store = ScriptStore(str(tmp_path / "s.db"))
         last_pct: list = []
@@ -3,6 +3,8 @@ Unit tests for StructureJSON, ClassInfo, FieldInfo models.
 """
 
 import json
+import sys
+
 import pytest
 
 from src.dumper.models import ClassInfo, FieldInfo, StructureJSON, _priority_sort
@@ -55,6 +57,13 @@ class TestStructureJSONSerialization:
         health = next(f for f in fields if f["name"] == "health")
         assert health["offset"] == "0x58"
 
+    def test_offset_int_parses_hex_and_rejects_garbage(self):
+        from src.dumper.models import FieldInfo
+        assert FieldInfo("a", "float", "0x58").offset_int == 0x58
+        assert FieldInfo("a", "float", "5C").offset_int == 0x5C
+        assert FieldInfo("a", "float", "").offset_int is None
+        assert FieldInfo("a", "float", "zz").offset_int is None
+
     def test_static_field_flagged(self, sample_structure):
         fields = sample_structure.to_dict()["classes"][0]["fields"]
         instance = next(f for f in fields if f["name"] == "instance")
@@ -65,6 +74,57 @@ class TestStructureJSONSerialization:
         health = next(f for f in fields if f["name"] == "health")
         assert "static" not in health
 
+    def test_from_json_round_trips(self, sample_structure):
+        restored = StructureJSON.from_json(sample_structure.to_json())
+        assert restored == sample_structure
+
+
+class TestUnityMonoDumpCache:
+    """UnityMonoDumper.dump() persists and reuses dumps per game build."""
+
+    @pytest.fixture
+    def engine_info(self, tmp_path):
+        from src.detector.models import EngineInfo, EngineType
+        exe = tmp_path / "Game.exe"
+        dll = tmp_path / "mono-2.0-bdwgc.dll"
+        exe.write_bytes(b"MZ")
+        dll.write_bytes(b"MZ")
+        return EngineInfo(
+            type=EngineType.UNITY_MONO, version="2021.3", bitness=64,
+            exe_path=str(exe), game_dir=str(tmp_path),
+            extra={"mono_dll_path": str(dll)},
+        )
+
+    def _dump(self, engine_info, cache_dir, classes):
+        from unittest.mock import patch
+
+        from src.dumper.unity_mono import UnityMonoDumper
+        with patch("src.dumper.unity_mono._IS_WINDOWS", True), \
+             patch("src.dumper.unity_mono._DUMP_CACHE_DIR", cache_dir), \
+             patch("src.dumper.unity_mono._MonoReader") as MockReader:
+            MockReader.return_value.read_all_classes.return_value = classes
+            result = UnityMonoDumper().dump(engine_info)
+        return result, MockReader
+
+    def test_second_dump_is_served_from_disk(self, engine_info, tmp_path):
+        cache_dir = tmp_path / "dumps"
+        first, _ = self._dump(engine_info, cache_dir, [ClassInfo("Player", "Game")])
+        second, reader = self._dump(engine_info, cache_dir, [])
+        reader.assert_not_called()
+        assert second == first
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_touching_mono_dll_invalidates_cache(self, engine_info, tmp_path):
+        import os
+        cache_dir = tmp_path / "dumps"
+        self._dump(engine_info, cache_dir, [ClassInfo("Player", "Game")])
+        dll = engine_info.extra["mono_dll_path"]
+        st = os.stat(dll)
+        os.utime(dll, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        result, reader = self._dump(engine_info, cache_dir, [ClassInfo("Enemy", "Game")])
+        reader.assert_called_once()
+        assert [c.name for c in result.classes] == ["Enemy"]
+
 
 class TestPromptStr:
     def test_prompt_str_contains_class_name(self, sample_structure):
@@ -214,6 +274,24 @@ namespace UnityEngine {
         assert len(classes[0].fields) == 3
 
 
+def _fake_memory(regions: dict[int, bytes]):
+    """
+    Build a fake ``read_bytes(addr, size)`` over sparse *regions*.
+
+    Reads may start anywhere and span several regions; unmapped bytes
+    read as zero, so bulk reads behave like real ReadProcessMemory.
+    """
+    def read_bytes(addr: int, size: int) -> bytes:
+        buf = bytearray(size)
+        for base, data in regions.items():
+            lo = max(addr, base)
+            hi = min(addr + size, base + len(data))
+            if lo < hi:
+                buf[lo - addr:hi - addr] = data[lo - base:hi - base]
+        return bytes(buf)
+    return read_bytes
+
+
 class TestUnityMonoDumperWalkAssemblies:
     """
     Test _MonoReader internals via mocked pymem.
@@ -238,12 +316,52 @@ class TestUnityMonoDumperWalkAssemblies:
         reader._pm.read_bytes.return_value = b"\x01\x00\x00\x00\x00\x00\x00\x00"
         assert reader._read_ptr(0x1000) == 1
 
-    def test_read_int32_reads_4_bytes_le(self, reader):
-        """_read_int32 reads 4 bytes as a little-endian unsigned int."""
+    def test_read_bytes_prefers_nt_reader_when_bound(self, reader):
+        """Once the ntdll fast path is bound, reads bypass pymem entirely."""
         from unittest.mock import MagicMock
         reader._pm = MagicMock()
-        reader._pm.read_bytes.return_value = b"\x0A\x00\x00\x00"
-        assert reader._read_int32(0x1000) == 10
+        reader._nt_read = MagicMock(return_value=b"\x2A\x00\x00\x00")
+        assert reader._read_bytes(0x1000, 4) == b"\x2A\x00\x00\x00"
+        reader._nt_read.assert_called_once_with(0x1000, 4)
+        reader._pm.read_bytes.assert_not_called()
+
+    def test_resolve_exports_caches_rvas_across_dumps(self, tmp_path):
+        """Export RVAs are resolved once per DLL file and rebased per reader."""
+        from unittest.mock import patch
+
+        from src.dumper import unity_mono
+        from src.dumper.unity_mono import _MonoReader
+
+        dll = tmp_path / "mono-2.0-bdwgc.dll"
+        dll.write_bytes(b"MZ")
+        with patch.dict(unity_mono._EXPORT_CACHE, clear=True), \
+             patch.object(unity_mono, "_load_export_rvas",
+                          return_value={"mono_domain_get": 0x1234}) as load:
+            first = _MonoReader("Game.exe", str(dll))
+            first._mono_base = 0x10000
+            first._resolve_exports()
+            second = _MonoReader("Game.exe", str(dll))
+            second._mono_base = 0x20000
+            second._resolve_exports()
+
+        load.assert_called_once()
+        assert first._exports == {"mono_domain_get": 0x11234}
+        assert second._exports == {"mono_domain_get": 0x21234}
+
+    def test_attach_without_pymem_raises_dumper_error(self, reader):
+        """A missing pymem install surfaces as DumperError with install hint."""
+        from unittest.mock import patch
+
+        from src.dumper import unity_mono
+        from src.exceptions import DumperError
+
+        unity_mono._load_pymem.cache_clear()
+        try:
+            with patch.dict(sys.modules, {"pymem": None}):
+                with pytest.raises(DumperError, match="pip install pymem"):
+                    reader._attach()
+        finally:
+            unity_mono._load_pymem.cache_clear()
 
     def test_read_cstring_stops_at_null(self, reader):
         """_read_cstring returns the string up to the first null byte."""
@@ -266,16 +384,32 @@ class TestUnityMonoDumperWalkAssemblies:
         code = b"\x48\x8B\x05\x05\x00\x00\x00" + b"\xC3" + b"\x00" * 24
         domain_ptr = 0xDEADBEEF00000001
 
-        def fake_read_bytes(addr, size):
-            if addr == fn_va:
-                return code
-            if addr == fn_va + 12:  # global_va
-                return domain_ptr.to_bytes(8, "little")
-            return b"\x00" * size
-
-        reader._pm.read_bytes.side_effect = fake_read_bytes
+        reader._pm.read_bytes.side_effect = _fake_memory({
+            fn_va: code,
+            fn_va + 12: domain_ptr.to_bytes(8, "little"),  # global_va
+        })
         result = reader._find_root_domain_ptr()
         assert result == domain_ptr
+        # Pattern at offset 0 is found by the short first read alone
+        assert reader._pm.read_bytes.call_args_list[0].args == (fn_va, 16)
+
+    def test_find_root_domain_widens_read_on_miss(self, reader):
+        """A MOV RAX past the first 16 bytes is found by the wider fallback read."""
+        from unittest.mock import MagicMock
+        reader._pm = MagicMock()
+
+        fn_va = reader._exports["mono_domain_get"]
+        # 24 bytes of prologue, then MOV RAX, [RIP+0]; global_va = fn_va + 31
+        code = b"\x90" * 24 + b"\x48\x8B\x05\x00\x00\x00\x00" + b"\xC3"
+        domain_ptr = 0x1234_5678_0000_0001
+
+        reader._pm.read_bytes.side_effect = _fake_memory({
+            fn_va: code,
+            fn_va + 31: domain_ptr.to_bytes(8, "little"),
+        })
+        assert reader._find_root_domain_ptr() == domain_ptr
+        sizes = [c.args[1] for c in reader._pm.read_bytes.call_args_list[:2]]
+        assert sizes == [16, 64]
 
     def test_find_root_domain_raises_if_no_mov_rax(self, reader):
         """_find_root_domain_ptr raises DumperError if pattern not found."""
@@ -289,7 +423,7 @@ class TestUnityMonoDumperWalkAssemblies:
 
     def test_walk_assemblies_returns_classes_from_glist(self, reader):
         """_walk_assemblies traverses GList and returns ClassInfo objects."""
-        from unittest.mock import MagicMock, patch
+        from unittest.mock import MagicMock, call, patch
 
         reader._pm = MagicMock()
 
@@ -338,13 +472,7 @@ class TestUnityMonoDumperWalkAssemblies:
             NS_STR_VAL:   b"Game.Player\x00",
         }
 
-        def fake_read(addr, size):
-            for base, data in memory.items():
-                if addr == base:
-                    return data[:size]
-            return b"\x00" * size
-
-        reader._pm.read_bytes.side_effect = fake_read
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
 
         # Patch _find_root_domain_ptr to return our fake domain
         with patch.object(reader, "_find_root_domain_ptr", return_value=DOMAIN):
@@ -353,6 +481,121 @@ class TestUnityMonoDumperWalkAssemblies:
         assert len(classes) >= 1
         names = [c.name for c in classes]
         assert "PlayerController" in names
+        # MonoImage header (0x10..0x30) is fetched with a single read
+        assert call(IMAGE + 0x10, 0x20) in reader._pm.read_bytes.call_args_list
+
+    def test_read_ptr_serves_same_page_from_cache(self, reader):
+        """Pointer reads on an already-fetched page do not hit the target again."""
+        import struct
+        from unittest.mock import MagicMock
+
+        reader._pm = MagicMock()
+        reader._pm.read_bytes.side_effect = _fake_memory({
+            0x20000: struct.pack("<QQ", 0xAAAA, 0xBBBB),
+            0x20FF8: struct.pack("<Q", 0xCCCC),
+        })
+        assert reader._read_ptr(0x20000) == 0xAAAA
+        assert reader._read_ptr(0x20008) == 0xBBBB
+        assert reader._read_ptr(0x20FF8) == 0xCCCC
+        reader._pm.read_bytes.assert_called_once_with(0x20000, 0x1000)
+
+    def test_read_ptr_spanning_pages_uses_both_cached_pages(self, reader):
+        """A pointer straddling a page boundary is stitched from two cached pages."""
+        import struct
+        from unittest.mock import MagicMock, call
+
+        reader._pm = MagicMock()
+        reader._pm.read_bytes.side_effect = _fake_memory({
+            0x20FFC: struct.pack("<Q", 0x1122_3344_5566_7788),
+        })
+        assert reader._read_ptr(0x20FFC) == 0x1122_3344_5566_7788
+        assert reader._read_ptr(0x21000) == 0x1122_3344
+        assert reader._pm.read_bytes.call_args_list == [
+            call(0x20000, 0x1000), call(0x21000, 0x1000),
+        ]
+
+    def test_read_assembly_classes_reads_shared_namespace_once(self, reader):
+        """Classes sharing one namespace pointer trigger a single string read."""
+        import struct
+        from unittest.mock import MagicMock
+
+        ASSEMBLY, IMAGE = 0x30000, 0x40000
+        NAMES, NS = 0x60000, 0x61000
+        NAME_A, NAME_B, NS_STR = 0x62000, 0x62100, 0x63000
+        memory = {
+            ASSEMBLY + 0x60: struct.pack("<Q", IMAGE),
+            IMAGE + 0x18: struct.pack("<I", 2),
+            IMAGE + 0x20: struct.pack("<QQ", NAMES, NS),
+            NAMES: struct.pack("<QQ", NAME_A, NAME_B),
+            NS: struct.pack("<QQ", NS_STR, NS_STR),
+            NAME_A: b"Player\x00",
+            NAME_B: b"Enemy\x00",
+            NS_STR: b"Game\x00",
+        }
+        reader._pm = MagicMock()
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
+
+        classes = reader._read_assembly_classes(ASSEMBLY)
+
+        assert [(c.name, c.namespace) for c in classes] == [
+            ("Player", "Game"), ("Enemy", "Game"),
+        ]
+        ns_reads = [
+            c for c in reader._pm.read_bytes.call_args_list
+            if c.args[0] <= NS_STR < c.args[0] + c.args[1]
+        ]
+        assert len(ns_reads) == 1
+
+    def test_read_cstrings_coalesces_nearby_pointers(self, reader):
+        """Strings within one page are fetched by a single span read."""
+        from unittest.mock import MagicMock
+
+        memory = {
+            0x5000: b"Player\x00",
+            0x5040: b"Enemy\x00",
+            0x5100: b"Game.Units\x00",
+            0x90000: b"Isolated\x00",
+        }
+        reader._pm = MagicMock()
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
+
+        result = reader._read_cstrings([0x5040, 0x5000, 0, 0x5100, 0x5000, 0x90000])
+
+        assert result == {
+            0: "", 0x5000: "Player", 0x5040: "Enemy",
+            0x5100: "Game.Units", 0x90000: "Isolated",
+        }
+        # one read for the 0x5000 cluster + one for the isolated pointer
+        assert reader._pm.read_bytes.call_count == 2
+
+    def test_read_assembly_classes_skips_rows_with_null_name(self, reader):
+        """A NULL class-name pointer drops the row before its namespace is read."""
+        import struct
+        from unittest.mock import MagicMock
+
+        ASSEMBLY, IMAGE = 0x30000, 0x40000
+        NAMES, NS = 0x60000, 0x61000
+        NAME_A, NS_A, NS_ORPHAN = 0x62000, 0x70000, 0x80000
+        memory = {
+            ASSEMBLY + 0x60: struct.pack("<Q", IMAGE),
+            IMAGE + 0x18: struct.pack("<I", 2),
+            IMAGE + 0x20: struct.pack("<QQ", NAMES, NS),
+            NAMES: struct.pack("<QQ", NAME_A, 0),
+            NS: struct.pack("<QQ", NS_A, NS_ORPHAN),
+            NAME_A: b"Player\x00",
+            NS_A: b"Game\x00",
+            NS_ORPHAN: b"Orphan\x00",
+        }
+        reader._pm = MagicMock()
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
+
+        classes = reader._read_assembly_classes(ASSEMBLY)
+
+        assert [(c.name, c.namespace) for c in classes] == [("Player", "Game")]
+        assert all(
+            not (c.args[0] <= NS_ORPHAN < c.args[0] + c.args[1])
+            for c in reader._pm.read_bytes.call_args_list
+        )
 
     def test_walk_assemblies_handles_null_assembly_gracefully(self, reader):
         """NULL assembly pointer in GList is skipped without crashing."""
@@ -369,7 +612,7 @@ class TestUnityMonoDumperWalkAssemblies:
             GLIST1 + 0x00: mk_ptr(0),   # NULL assembly
             GLIST1 + 0x08: mk_ptr(0),   # end of list
         }
-        reader._pm.read_bytes.side_effect = lambda a, s: memory.get(a, b"\x00"*s)[:s]
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
 
         with patch.object(reader, "_find_root_domain_ptr", return_value=DOMAIN):
             classes = reader._walk_assemblies()
@@ -394,7 +637,7 @@ class TestUnityMonoDumperWalkAssemblies:
             memory[node + 0x00] = mk_ptr(0)         # NULL assembly (skip)
             memory[node + 0x08] = mk_ptr(nodes[i+1] if i < len(nodes)-1 else 0)
 
-        reader._pm.read_bytes.side_effect = lambda a, s: memory.get(a, b"\x00"*s)[:s]
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
 
         from src.dumper.unity_mono import _MAX_ASSEMBLIES
 
@@ -402,9 +645,49 @@ class TestUnityMonoDumperWalkAssemblies:
             classes = reader._walk_assemblies()
 
         assert classes == []
-        # Each capped iteration reads assembly_ptr + next_ptr = 2 reads per node
-        # Plus the initial glist_ptr read = 1. Total <= _MAX_ASSEMBLIES * 2 + 1
-        assert reader._pm.read_bytes.call_count <= _MAX_ASSEMBLIES * 2 + 1
+        # Each capped iteration reads the whole (data, next) node = 1 read per node
+        # Plus the initial glist_ptr read = 1. Total <= _MAX_ASSEMBLIES + 1
+        assert reader._pm.read_bytes.call_count <= _MAX_ASSEMBLIES + 1
+
+    def test_walk_assemblies_reads_in_parallel_keeping_order(self, reader):
+        """Per-assembly reads run on a pool; results keep GList order, failures skip."""
+        import struct
+        from unittest.mock import MagicMock, patch
+
+        from src.dumper.models import ClassInfo
+
+        reader._pm = MagicMock()
+        DOMAIN = 0x10000
+        nodes = [0x20000 + i * 0x10 for i in range(12)]
+        assemblies = [0x90000 + i for i in range(12)]
+
+        def mk_ptr(v): return struct.pack("<Q", v)
+        memory: dict = {DOMAIN + 0xD0: mk_ptr(nodes[0])}
+        for i, node in enumerate(nodes):
+            memory[node + 0x00] = mk_ptr(assemblies[i])
+            memory[node + 0x08] = mk_ptr(nodes[i + 1] if i < len(nodes) - 1 else 0)
+        reader._pm.read_bytes.side_effect = _fake_memory(memory)
+
+        def fake_read(assembly_ptr):
+            if assembly_ptr == assemblies[3]:
+                raise OSError("unreadable")
+            return [ClassInfo(name=f"C{assembly_ptr - 0x90000}", namespace="")]
+
+        with patch.object(reader, "_find_root_domain_ptr", return_value=DOMAIN), \
+             patch.object(reader, "_read_assembly_classes", side_effect=fake_read):
+            classes = reader._walk_assemblies()
+
+        assert [c.name for c in classes] == [f"C{i}" for i in range(12) if i != 3]
+
+    def test_read_ptr_tables_is_one_read_per_table(self, reader):
+        """_read_ptr_tables fetches each pointer table in one read_bytes call."""
+        import struct
+        from unittest.mock import MagicMock
+
+        reader._pm = MagicMock()
+        reader._pm.read_bytes.return_value = struct.pack("<3Q", 0x10, 0, 0x30)
+        assert reader._read_ptr_tables([0x6000, 0], 3) == [[0x10, 0, 0x30], [0, 0, 0]]
+        reader._pm.read_bytes.assert_called_once_with(0x6000, 24)
 
 
 class TestUnrealDumperUE4SS:
@@ -486,6 +769,29 @@ class TestUnrealDumperUE4SS:
         t.join()
         assert (tmp_path / "ObjectDump.txt").exists()
 
+    def test_wait_for_file_uses_change_notification(self, tmp_path):
+        """On Windows, _wait_for_file blocks on the change handle and closes it."""
+        from unittest.mock import MagicMock, patch
+
+        from src.dumper.ue import UnrealDumper
+
+        dump_file = tmp_path / "ObjectDump.txt"
+        kernel32 = MagicMock()
+
+        def fake_wait(handle, timeout_ms):
+            dump_file.write_text("Class /Script/Engine.Actor\n")
+            return 0  # WAIT_OBJECT_0
+
+        kernel32.WaitForSingleObject.side_effect = fake_wait
+
+        with patch("src.dumper.ue._IS_WINDOWS", True), \
+             patch("src.dumper.ue._open_change_notification",
+                   return_value=(kernel32, 0x44)):
+            assert UnrealDumper._wait_for_file(dump_file, 5.0) is True
+
+        kernel32.WaitForSingleObject.assert_called_once()
+        kernel32.FindCloseChangeNotification.assert_called_once_with(0x44)
+
     def test_trigger_raises_if_game_window_not_found(self, ue4_info, tmp_path):
         """If game window cannot be found, raises DumperError with instructions."""
         from unittest.mock import patch
@@ -50,6 +50,64 @@ class TestProcessListViewModel:
         assert len(filtered) == 1
         assert filtered[0].name == "MyGame.exe"
 
+    def test_filter_narrowing_and_widening_stay_correct(self):
+        from src.gui.viewmodels import ProcessInfo
+        vm = self._vm()
+        vm.set_processes([
+            ProcessInfo(pid=1, name="MyGame.exe"),
+            ProcessInfo(pid=2, name="GameBar.exe"),
+            ProcessInfo(pid=3, name="chrome.exe"),
+        ])
+        names = []
+        for text in ("g", "ga", "gamEB", "ga", "e.EXE"):
+            vm.filter_text = text
+            names.append([p.name for p in vm.filtered_processes])
+        assert names == [
+            ["MyGame.exe", "GameBar.exe"],
+            ["MyGame.exe", "GameBar.exe"],
+            ["GameBar.exe"],
+            ["MyGame.exe", "GameBar.exe"],
+            ["MyGame.exe", "chrome.exe"],
+        ]
+
+    def test_filter_requires_every_whitespace_separated_term(self):
+        from src.gui.viewmodels import ProcessInfo
+        vm = self._vm()
+        vm.set_processes([
+            ProcessInfo(pid=1, name="PlayerController.exe"),
+            ProcessInfo(pid=2, name="Player.exe"),
+        ])
+        vm.filter_text = "play"
+        assert len(vm.filtered_processes) == 2
+        vm.filter_text = "play CONTROL"
+        assert [p.pid for p in vm.filtered_processes] == [1]
+        vm.filter_text = "pla"
+        assert len(vm.filtered_processes) == 2
+
+    def test_filter_supports_wildcards(self):
+        from src.gui.viewmodels import ProcessInfo
+        vm = self._vm()
+        vm.set_processes([
+            ProcessInfo(pid=1, name="UnityCrashHandler64.exe"),
+            ProcessInfo(pid=2, name="Game64.exe"),
+            ProcessInfo(pid=3, name="unity.dll.exe"),
+        ])
+        vm.filter_text = "unity*64"
+        assert [p.pid for p in vm.filtered_processes] == [1]
+        vm.filter_text = "game??.EXE"
+        assert [p.pid for p in vm.filtered_processes] == [2]
+        vm.filter_text = "y.d"   # '.' is literal
+        assert [p.pid for p in vm.filtered_processes] == [3]
+
+    def test_filter_sees_directly_assigned_processes(self):
+        from src.gui.viewmodels import ProcessInfo
+        vm = self._vm()
+        vm.set_processes([ProcessInfo(pid=1, name="game.exe")])
+        vm.filter_text = "game"
+        assert len(vm.filtered_processes) == 1
+        vm.processes = [ProcessInfo(pid=2, name="other.exe")]
+        assert vm.filtered_processes == []
+
     def test_select_process_updates_selected(self):
         from src.gui.viewmodels import ProcessInfo
         vm = self._vm()
@@ -62,6 +120,26 @@ class TestProcessListViewModel:
         vm = self._vm()
         assert vm.selected is None
 
+    def test_rescan_keeps_selection_only_if_process_still_runs(self):
+        from src.gui.viewmodels import ProcessInfo
+        vm = self._vm()
+        vm.set_processes([ProcessInfo(pid=42, name="game.exe")])
+        vm.select(vm.processes[0])
+        vm.set_processes([ProcessInfo(pid=42, name="game.exe")])  # equal, new object
+        assert vm.selected == ProcessInfo(pid=42, name="game.exe")
+        vm.set_processes([ProcessInfo(pid=43, name="game.exe")])
+        assert vm.selected is None
+
+    def test_process_info_is_immutable_and_hashable(self):
+        import dataclasses
+
+        from src.gui.viewmodels import ProcessInfo
+        p = ProcessInfo(pid=1, name="game.exe")
+        assert {p, ProcessInfo(pid=1, name="game.exe")} == {p}
+        assert not hasattr(p, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            p.pid = 2
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. FeatureConfigViewModel
@@ -80,7 +158,7 @@ class TestFeatureConfigViewModel:
 
     def test_selected_features_initially_empty(self):
         vm = self._vm()
-        assert vm.selected_features == []
+        assert vm.selected_features == set()
 
     def test_toggle_feature_adds_it(self):
         vm = self._vm()
@@ -95,6 +173,16 @@ class TestFeatureConfigViewModel:
         vm.toggle(feature)  # remove
         assert feature not in vm.selected_features
 
+    def test_selected_features_ordered_follows_display_order(self):
+        vm = self._vm()
+        vm.toggle("custom_b")
+        vm.toggle(vm.standard_features[2])
+        vm.toggle(vm.standard_features[0])
+        vm.toggle("custom_a")
+        assert vm.selected_features_ordered == [
+            vm.standard_features[0], vm.standard_features[2], "custom_a", "custom_b",
+        ]
+
     def test_custom_description_defaults_to_empty_string(self):
         vm = self._vm()
         assert vm.custom_description == ""
@@ -122,6 +210,14 @@ class TestGenerateViewModel:
         assert len(vm.log_lines) == 2
         assert "Starting analysis" in vm.log_lines[0]
 
+    def test_log_lines_drop_oldest_past_cap(self):
+        from src.gui.viewmodels import MAX_LOG_LINES
+        vm = self._vm()
+        for i in range(MAX_LOG_LINES + 5):
+            vm.append_log(f"line {i}")
+        assert len(vm.log_lines) == MAX_LOG_LINES
+        assert vm.log_lines[0] == "line 5"
+
     def test_set_progress_clamps_between_0_and_1(self):
         vm = self._vm()
         vm.set_progress(1.5)
@@ -179,3 +275,59 @@ class TestScriptManagerViewModel:
         visible = vm.visible_records
         assert len(visible) == 1
         assert visible[0].game_name == "Hollow Knight"
+
+    def test_search_query_matches_word_prefixes(self):
+        from src.store.models import ScriptRecord
+        vm = self._vm()
+        vm.load([
+            ScriptRecord(game_hash=f"h{i}", game_name=name, engine_type="UE4",
+                         feature="f", lua_script="--")
+            for i, name in enumerate(["Hollow Knight", "Half-Life 2", "Pokémon Go"])
+        ])
+        for query, expected in [
+            ("holl", ["Hollow Knight"]),
+            ("ollow", []),                      # not at a word start
+            ("kni holl", ["Hollow Knight"]),    # any order
+            ("half-li", ["Half-Life 2"]),       # consecutive words
+            ("pokemon", ["Pokémon Go"]),        # accent-insensitive
+            ("-", []),
+            ("h", ["Hollow Knight", "Half-Life 2"]),
+        ]:
+            vm.search_query = query
+            assert [r.game_name for r in vm.visible_records] == expected, query
+
+    def test_loaded_and_store_search_agree(self, tmp_path):
+        """Filtering a loaded list matches what ScriptStore.search returns."""
+        from src.store.db import ScriptStore
+        from src.store.models import ScriptRecord
+        names = ["Hollow Knight", "Dark Souls III", "Half-Life 2", "my_game", "Pokémon Go"]
+        records = [
+            ScriptRecord(game_hash=f"h{i}", game_name=n, engine_type="UE4",
+                         feature="f", lua_script="--")
+            for i, n in enumerate(names)
+        ]
+        store = ScriptStore(str(tmp_path / "s.db"))
+        store.save_many(records)
+        vm = self._vm()
+        vm.load(records)
+        for query in ["ho", "ark", "souls d", "life", "half-l", "game", "poke", "2", "-"]:
+            vm.search_query = query
+            assert (
+                sorted(r.game_name for r in vm.visible_records)
+                == sorted(r.game_name for r in store.search(query))
+            ), query
+
+    def test_bound_store_is_read_in_windows(self, tmp_path):
+        from src.store.db import ScriptStore
+        from src.store.models import ScriptRecord
+        store = ScriptStore(str(tmp_path / "s.db"))
+        for i in range(5):
+            store.save(ScriptRecord(game_hash=f"h{i}", game_name=f"Game{i}",
+                                    engine_type="UE4", feature="f", lua_script="--"))
+        vm = self._vm()
+        vm.bind_store(store)
+        assert vm.records == [] and vm.total_count == 5 and vm.has_more
+        assert len(vm.fetch_more(limit=3)) == 3
+        assert len(vm.fetch_more(limit=3)) == 2
+        assert not vm.has_more
+        assert len({r.id for r in vm.records}) == 5
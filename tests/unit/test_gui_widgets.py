@@ -38,6 +38,18 @@ def app():
     # Don't call app.quit() — other tests in the session may still need it.
 
 
+def _wait_until(predicate, timeout_ms: int = 2000) -> None:
+    """Process Qt events until *predicate* holds; fail after *timeout_ms*."""
+    import time
+
+    from PyQt6.QtCore import QCoreApplication
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met before timeout"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. MainWindow
 # ─────────────────────────────────────────────────────────────────────────────
@@ -79,6 +91,50 @@ class TestProcessSelectPage:
         labels = [b.text().lower() for b in buttons]
         assert any("refresh" in lbl for lbl in labels)
 
+    def test_refresh_scans_off_thread_and_fills_list(self, app):
+        from src.gui.pages import process_select
+        from src.gui.viewmodels import ProcessInfo
+        page = process_select.ProcessSelectPage()
+        procs = [ProcessInfo(pid=7, name="Game.exe")]
+        with patch.object(process_select, "_scan_processes", return_value=procs):
+            page._refresh_btn.click()
+            _wait_until(lambda: page._list_widget.count() == 1)
+        assert page._list_widget.item(0).text() == "Game.exe (pid=7)"
+        assert page._refresh_btn.isEnabled()
+
+    def test_scan_processes_is_memoised_within_ttl(self, monkeypatch):
+        pytest.importorskip("psutil")
+        from src.gui.pages import process_select
+        monkeypatch.setattr(process_select, "_scan_cache", None)
+        proc = MagicMock(info={"pid": 1, "name": "a.exe", "exe": None})
+        with patch("psutil.process_iter", return_value=[proc]) as it:
+            first = process_select._scan_processes()
+            second = process_select._scan_processes()
+        it.assert_called_once()
+        assert first == second == [process_select.ProcessInfo(pid=1, name="a.exe")]
+
+    def test_filter_hides_items_without_rebuilding(self, app):
+        from src.gui.pages.process_select import ProcessSelectPage
+        from src.gui.viewmodels import ProcessInfo
+        page = ProcessSelectPage()
+        page._vm.set_processes([
+            ProcessInfo(pid=1, name="MyGame.exe"),
+            ProcessInfo(pid=2, name="chrome.exe"),
+        ])
+        page._rebuild_list()
+        items = [page._list_widget.item(i) for i in range(2)]
+
+        page._filter_edit.setText("chrome")
+        assert page._list_widget.count() == 2
+        assert [page._list_widget.item(i) for i in range(2)] == items
+        assert [it.isHidden() for it in items] == [True, False]
+
+        page._list_widget.setCurrentRow(1)
+        assert page._vm.selected.pid == 2
+        page._filter_edit.setText("game")       # selected row becomes hidden
+        assert page._vm.selected is None
+        assert not page._select_btn.isEnabled()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 3. FeatureConfigPage
@@ -101,6 +157,24 @@ class TestFeatureConfigPage:
         labels = [b.text().lower() for b in buttons]
         assert any("generate" in lbl for lbl in labels)
 
+    def test_checkbox_toggle_updates_viewmodel(self, app):
+        from src.gui.pages.feature_config import FeatureConfigPage
+        page = FeatureConfigPage()
+        cb = page._checkboxes[page._vm.standard_features.index("infinite_mana")]
+        cb.setChecked(True)
+        assert page._vm.selected_features == {"infinite_mana"}
+        cb.setChecked(False)
+        assert page._vm.selected_features == set()
+
+    def test_checkboxes_laid_out_in_two_columns(self, app):
+        from PyQt6.QtWidgets import QGridLayout
+
+        from src.gui.pages.feature_config import FeatureConfigPage
+        page = FeatureConfigPage()
+        grid = page._checkboxes[0].parentWidget().layout()
+        assert isinstance(grid, QGridLayout)
+        assert grid.columnCount() == 2
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 4. GeneratePage
@@ -122,6 +196,55 @@ class TestGeneratePage:
         bars = page.findChildren(QProgressBar)
         assert len(bars) >= 1
 
+    def test_append_log_batches_display_updates(self, app):
+        from src.gui.pages.generate import GeneratePage
+        page = GeneratePage()
+        page.append_log("step 1")
+        page.append_log("step 2")
+        assert page._log_view.toPlainText() == ""   # not yet flushed
+        assert page._flush_timer.isActive()
+        page._flush_log()
+        assert page._log_view.toPlainText() == "step 1\nstep 2"
+        assert list(page._vm.log_lines) == ["step 1", "step 2"]
+
+    def test_flushing_log_keeps_user_selection(self, app):
+        from PyQt6.QtGui import QTextCursor
+
+        from src.gui.pages.generate import GeneratePage
+        page = GeneratePage()
+        page.append_log("first")
+        page._flush_log()
+        cursor = page._log_view.textCursor()
+        cursor.setPosition(0)
+        cursor.setPosition(3, QTextCursor.MoveMode.KeepAnchor)
+        page._log_view.setTextCursor(cursor)
+        page.append_log("second")
+        page._flush_log()
+        assert page._log_view.toPlainText() == "first\nsecond"
+        assert page._log_view.textCursor().selectedText() == "fir"
+
+        page.reset()
+        page.append_log("again")
+        page._flush_log()
+        assert page._log_view.toPlainText() == "again"
+
+    def test_repeated_updates_are_skipped_in_display_only(self, app):
+        from src.gui.pages.generate import GeneratePage
+        page = GeneratePage()
+        for line in ("Scanning…", "", "Scanning…", "done"):
+            page.append_log(line)
+        # The history keeps every line, repeats and empty lines included
+        assert list(page._vm.log_lines) == ["Scanning…", "", "Scanning…", "done"]
+        page._flush_log()
+        assert page._log_view.toPlainText() == "Scanning…\n\ndone"
+
+        page.set_progress(0.42)
+        page._progress_bar.setValue(7)   # sentinel: unchanged pct must not overwrite
+        page.set_progress(0.421)
+        assert page._progress_bar.value() == 7
+        page.set_progress(0.5)
+        assert page._progress_bar.value() == 50
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 5. ScriptManagerPage
@@ -129,13 +252,58 @@ class TestGeneratePage:
 
 class TestScriptManagerPage:
 
-    def test_has_table_widget(self, app):
+    def test_has_table_view(self, app):
+        from PyQt6.QtWidgets import QTableView
+
         from src.gui.pages.script_manager import ScriptManagerPage
-        from PyQt6.QtWidgets import QTableWidget
         page = ScriptManagerPage()
-        tables = page.findChildren(QTableWidget)
+        tables = page.findChildren(QTableView)
         assert len(tables) >= 1
 
+    def test_load_records_and_search_drive_the_model(self, app):
+        from src.gui.pages.script_manager import ScriptManagerPage
+        from src.store.models import ScriptRecord
+        page = ScriptManagerPage()
+        page.load_records([
+            ScriptRecord(game_hash="h1", game_name="Hollow Knight", engine_type="Unity_Mono",
+                         feature="inf_hp", lua_script="--", id=1, success_count=3),
+            ScriptRecord(game_hash="h2", game_name="Dark Souls", engine_type="UE4",
+                         feature="speed", lua_script="--", id=2),
+        ])
+        model = page._table.model()
+        assert model.rowCount() == 2
+        assert model.data(model.index(0, 1)) == "Hollow Knight"
+        assert model.data(model.index(0, 3)) == "3 / 0"
+
+        page._search_edit.setText("dark")
+        assert model.rowCount() == 1
+        assert model.data(model.index(0, 2)) == "speed"
+        page._search_edit.setText("ark")       # word prefixes only, like the store
+        assert model.rowCount() == 0
+        page._search_edit.setText("kni HOLL")
+        assert model.data(model.index(0, 1)) == "Hollow Knight"
+
+    def test_bound_store_fetches_rows_on_demand(self, app, tmp_path):
+        from src.gui.pages.script_manager import ScriptManagerPage
+        from src.gui.viewmodels import SCRIPT_PAGE_SIZE
+        from src.store.db import ScriptStore
+        from src.store.models import ScriptRecord
+        store = ScriptStore(str(tmp_path / "s.db"))
+        for i in range(SCRIPT_PAGE_SIZE + 5):
+            store.save(ScriptRecord(game_hash=f"h{i}", game_name=f"Game{i}",
+                                    engine_type="UE4", feature="f", lua_script="--"))
+        page = ScriptManagerPage()
+        page.bind_store(store)
+        model = page._table.model()
+        assert model.rowCount() == SCRIPT_PAGE_SIZE
+        assert model.canFetchMore(model.index(-1, -1))
+        model.fetchMore(model.index(-1, -1))
+        assert model.rowCount() == SCRIPT_PAGE_SIZE + 5
+
+        page._search_edit.setText("Game7")
+        # Word prefix: Game7, Game70..Game79
+        assert model.rowCount() == 11
+
     def test_has_export_button(self, app):
         from src.gui.pages.script_manager import ScriptManagerPage
         from PyQt6.QtWidgets import QPushButton
@@ -227,6 +395,26 @@ class TestGenerateWorker:
 
         assert any("halfway there" in line for line in log_lines)
 
+    def test_worker_drops_repeated_progress_messages(self, tmp_path):
+        """Repeated lines and unchanged whole percentages are emitted only once."""
+        worker = self._make_worker()
+        log_lines, progress_values = [], []
+        worker.log_emitted.connect(log_lines.append)
+        worker.progress_updated.connect(progress_values.append)
+
+        def fake_generate(*args, **kwargs):
+            cb = kwargs["progress_cb"]
+            cb(0.5, "same")
+            cb(0.5, "same")
+            cb(0.504, "other")   # same whole percentage
+            return tmp_path / "out.lua"
+
+        with patch("src.gui.worker.cmd_generate", side_effect=fake_generate):
+            worker.run()
+
+        assert log_lines == ["[ 50%] same", "[ 50%] other"]
+        assert progress_values == [0.5]
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 7. MainWindowWiring
@@ -285,6 +473,53 @@ class TestMainWindowWiring:
 
         assert win._page_generate._log_view.toPlainText() == ""  # was reset
 
+    def test_worker_thread_is_reused_across_runs(self, tmp_path, qtbot):
+        """Repeated Generate clicks queue jobs on one long-lived thread + worker."""
+        from unittest.mock import MagicMock, patch
+
+        from src.gui.viewmodels import ProcessInfo
+
+        win = self._make_window(tmp_path)
+        qtbot.addWidget(win)
+        win._page_process._vm.selected = ProcessInfo(
+            pid=1, name="Game.exe", exe_path="/fake/Game.exe"
+        )
+
+        with patch("src.gui.main_window.GenerateWorker") as MockWorker, \
+             patch("src.gui.main_window.QThread") as MockThread:
+            mock_w = MagicMock()
+            MockWorker.return_value = mock_w
+            win._page_features._generate_btn.click()
+            win._page_features._generate_btn.click()
+
+        MockWorker.assert_called_once()
+        MockThread.assert_called_once()
+        MockThread.return_value.start.assert_called_once()
+        assert mock_w.start.call_count == 2
+        mock_w.start.assert_called_with("/fake/Game.exe", [])
+
+    def test_close_waits_for_running_job(self, tmp_path, qtbot):
+        """Closing mid-run is deferred until the worker reports back."""
+        import sqlite3
+        from unittest.mock import MagicMock, patch
+
+        win = self._make_window(tmp_path)
+        qtbot.addWidget(win)
+        with patch("src.gui.main_window.GenerateWorker", return_value=MagicMock()), \
+             patch("src.gui.main_window.QThread") as MockThread:
+            win._page_features._generate_btn.click()
+        thread = MockThread.return_value
+
+        assert win.close() is False            # ignored while the job runs
+        thread.quit.assert_not_called()
+        assert win._store.count() == 0         # store still open
+
+        win._on_generate_failed("boom")        # job ends → deferred close runs
+        thread.quit.assert_called_once()
+        thread.wait.assert_called_once_with()  # no timeout
+        with pytest.raises(sqlite3.ProgrammingError):
+            win._store.count()
+
     def test_worker_finished_navigates_to_script_manager(self, tmp_path, qtbot):
         """On worker finished signal, MainWindow navigates to ScriptManagerPage (index 3)."""
         from src.gui.viewmodels import ProcessInfo
@@ -134,6 +134,17 @@ class TestFieldResolutionHelpers:
         r = FieldResolution("C", "f", "SomeUnknownType", ResolutionStrategy.MONO_API)
         assert r.ce_read_fn() == "readFloat"
 
+    def test_models_use_slots(self):
+        r = FieldResolution("C", "f", "float", ResolutionStrategy.MONO_API)
+        assert not hasattr(r, "__dict__")
+        assert not hasattr(EngineContext(engine_type="UE4"), "__dict__")
+
+    def test_write_fn_mirrors_read_fn_for_every_type(self):
+        from src.resolver.models import _CE_READ, _CE_WRITE, _ce_read, _ce_write
+        assert _CE_WRITE.keys() == _CE_READ.keys()
+        for ftype in [*_CE_READ, "Int32", "SomeUnknownType"]:
+            assert _ce_write(ftype) == _ce_read(ftype).replace("read", "write")
+
     def test_str_representation(self):
         r = FieldResolution("PlayerController", "health", "float",
                             ResolutionStrategy.MONO_API)
@@ -172,6 +183,16 @@ class TestEngineContext:
         assert ctx.engine_type == "UE4"
         assert ctx.module_name == "Game-Win64-Shipping.exe"
 
+    def test_from_engine_info_mono_has_no_module(self):
+        class FakeInfo:
+            type = type("T", (), {"value": "Unity_Mono"})()
+            version = "2019.4"
+            bitness = 64
+            exe_path = "/game/Game.exe"
+            extra = {"primary_module": "ignored.dll"}
+
+        assert EngineContext.from_engine_info(FakeInfo()).module_name == ""
+
 
 # ── MonoResolver ──────────────────────────────────────────────────────────────
 
@@ -189,10 +210,21 @@ class TestMonoResolver:
             assert r.lua_write_expr, f"Missing lua_write_expr for {r.field_name}"
 
     def test_lua_read_expr_uses_mono_offset(self, mono_context):
-        health = next(r for r in mono_context.resolutions if r.field_name == "health")
+        structure = StructureJSON(
+            engine="Unity_Mono", version="2022.3.10",
+            classes=[ClassInfo(name="PlayerController", namespace="Game.Player",
+                               fields=[FieldInfo(name="health", type="float", offset="")])],
+        )
+        health = MonoResolver().resolve(structure, mono_context)[0]
         assert "_monoOffset" in health.lua_read_expr
         assert "PlayerController" in health.lua_read_expr
 
+    def test_known_offset_is_inlined(self, mono_context):
+        health = next(r for r in mono_context.resolutions if r.field_name == "health")
+        assert health.lua_read_expr == "readFloat(_getObj_PlayerController() + 0x58)"
+        assert health.lua_write_expr == "writeFloat(_getObj_PlayerController() + 0x58, {value})"
+        assert health.field_offset == 0x58
+
     def test_lua_write_expr_contains_value_placeholder(self, mono_context):
         health = next(r for r in mono_context.resolutions if r.field_name == "health")
         assert "{value}" in health.lua_write_expr
@@ -213,6 +245,42 @@ class TestMonoResolver:
         assert "_monoOffset" in preamble
         assert "mono_findClass" in preamble
 
+    def test_preamble_localises_bridge_functions(self, mono_context):
+        preamble = MonoResolver().preamble_lua(mono_context)
+        local_at = preamble.index("local mono_findClass, mono_getClassField")
+        assert local_at < preamble.index("local function _monoClass")
+
+    def test_preamble_caches_are_nested_not_concatenated(self, mono_context):
+        preamble = MonoResolver().preamble_lua(mono_context)
+        assert '" .. ' not in preamble
+
+    def test_preamble_helpers_run_and_memoize(self, mono_context):
+        """Execute the preamble with mocked mono_* bridge functions."""
+        lupa = pytest.importorskip("lupa", reason="lupa (Lua runtime) not installed")
+        lua = lupa.LuaRuntime()
+        lua.execute(
+            "calls = 0\n"
+            "function mono_findClass(a, ns, n)\n"
+            "  calls = calls + 1\n"
+            "  if n == 'Missing' then return nil end\n"
+            "  return {}\n"
+            "end\n"
+            "function mono_getClassField(c, f) calls = calls + 1; return {} end\n"
+            "function mono_getFieldOffset(f) calls = calls + 1; return 0x58 end\n"
+        )
+        preamble = MonoResolver().preamble_lua(mono_context)
+        mono_field, mono_offset = lua.execute(preamble + "\nreturn _monoField, _monoOffset")
+
+        assert mono_offset("Game.Player", "PlayerController", "health") == 0x58
+        assert mono_offset("Game.Player", "PlayerController", "health") == 0x58
+        assert mono_field("Game.Player", "PlayerController", "health") is not None
+        assert lua.globals().calls == 3          # class + field + offset, once each
+
+        # misses are retried rather than cached
+        assert mono_offset("Game", "Missing", "x") is None
+        assert mono_offset("Game", "Missing", "x") is None
+        assert lua.globals().calls == 5
+
     def test_preamble_contains_assembly_name(self, mono_context):
         preamble = MonoResolver().preamble_lua(mono_context)
         assert "Assembly-CSharp" in preamble
@@ -251,6 +319,14 @@ class TestIL2CPPResolver:
         preamble = IL2CPPResolver().preamble_lua(il2cpp_context)
         assert "GameAssembly.dll" in preamble
 
+    def test_preamble_rendered_once_per_module_and_bitness(self):
+        ctx64 = EngineContext(engine_type="Unity_IL2CPP", bitness=64)
+        ctx32 = EngineContext(engine_type="Unity_IL2CPP", bitness=32)
+        first = IL2CPPResolver().preamble_lua(ctx64)
+        assert IL2CPPResolver().preamble_lua(ctx64) is first
+        assert "pointer size = 4 bytes" in IL2CPPResolver().preamble_lua(ctx32)
+        assert "pointer size = 8 bytes" in first
+
     def test_field_without_offset_is_skipped(self):
         """Fields with no offset info should be silently skipped."""
         struct = StructureJSON(
@@ -289,6 +365,26 @@ class TestUnrealResolver:
         assert "_findActor" in preamble
         assert "GUObjectArray" in preamble
 
+    def test_preamble_localises_memory_api_and_hoists_array_base(self, ue4_context):
+        preamble = UnrealResolver().preamble_lua(ue4_context)
+        assert "local readPointer, readInteger" in preamble
+        walker = preamble[preamble.index("local function _findActor"):]
+        assert "local slot = _GObjects + 0x18" in walker
+        assert "for i = 0" not in walker
+
+    def test_find_actor_compares_fname_indices(self, ue4_context):
+        preamble = UnrealResolver().preamble_lua(ue4_context)
+        walker = preamble[preamble.index("local function _findActor"):]
+        assert "nameIdx == target" in walker
+        assert "_getClassName(obj)" not in walker
+        assert "local _nameCache" in preamble
+
+    def test_preambles_rendered_once_per_input(self, ue4_context, mono_context):
+        ue4 = UnrealResolver().preamble_lua(ue4_context)
+        mono = MonoResolver().preamble_lua(mono_context)
+        assert UnrealResolver().preamble_lua(ue4_context) is ue4
+        assert MonoResolver().preamble_lua(mono_context) is mono
+
     def test_ue5_preamble_uses_ue5_aob(self):
         ctx = EngineContext(engine_type="UE5", engine_version="5.1")
         preamble = UnrealResolver().preamble_lua(ctx)
@@ -322,6 +418,10 @@ class TestGetResolverFactory:
         r = get_resolver("")
         assert isinstance(r, IL2CPPResolver)
 
+    def test_resolvers_are_shared_per_class(self):
+        assert get_resolver("UE4") is get_resolver("UE5")
+        assert get_resolver("Unknown") is get_resolver("Unity_IL2CPP")
+
 
 # ── PromptBuilder engine-aware system prompts ─────────────────────────────────
 
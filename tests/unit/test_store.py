@@ -12,12 +12,11 @@ Total       = 14 new tests
 """
 
 import sqlite3
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
-
 # ─────────────────────────────────────────────────────────────────────────────
 # 1. ScriptRecord model
 # ─────────────────────────────────────────────────────────────────────────────
@@ -54,6 +53,26 @@ class TestScriptRecord:
         assert rec.success_count == 0
         assert rec.fail_count == 0
 
+    def test_models_import_does_not_load_sqlite(self):
+        import subprocess
+        import sys
+        code = (
+            "import sys, src.store.models, src.store; "
+            "assert 'sqlite3' not in sys.modules; "
+            "from src.store import ScriptStore; "
+            "assert 'sqlite3' in sys.modules"
+        )
+        root = Path(__file__).resolve().parents[2]
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+    def test_uses_slots(self):
+        from src.store.models import ScriptRecord
+        rec = ScriptRecord(
+            game_hash="x", game_name="g", engine_type="UE4",
+            feature="f", lua_script="l",
+        )
+        assert not hasattr(rec, "__dict__")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 2. ScriptStore CRUD
@@ -120,6 +139,40 @@ class TestScriptStoreGet:
         rec = store.get(game_hash="missing", feature="anything")
         assert rec is None
 
+    def test_save_many_commits_batch_once(self, store):
+        records = [_record(game_hash=f"h{i}", feature="f") for i in range(5)]
+        ids = store.save_many(records + [_record(game_hash="h0", feature="f", lua_script="v2")])
+        assert len(set(ids)) == 5 and ids[0] == ids[-1]
+        assert store.get("h0", "f").lua_script == "v2"
+
+    def test_save_many_is_all_or_nothing(self, store):
+        bad = _record(game_hash="bad")
+        bad.aob_sigs = None  # NOT NULL violation
+        with pytest.raises(sqlite3.IntegrityError):
+            store.save_many([_record(game_hash="ok"), bad])
+        assert store.count() == 0
+
+    def test_long_scripts_are_stored_compressed(self, store):
+        long_script = "writeFloat(_getBase() + 0x58, 100.0)\n" * 200
+        store.save(_record(feature="long", lua_script=long_script))
+        store.save(_record(feature="short", lua_script="-- short"))
+        raw = dict(store._conn.execute("SELECT feature, lua_script FROM scripts"))
+        assert isinstance(raw["long"], bytes) and len(raw["long"]) < len(long_script) // 5
+        assert raw["short"] == "-- short"
+        assert store.get("hash1", "long").lua_script == long_script
+        assert store.get("hash1", "short").lua_script == "-- short"
+
+    def test_get_many_returns_hits_keyed_by_pair(self, store, monkeypatch):
+        import src.store.db as db
+        monkeypatch.setattr(db, "_GET_MANY_BATCH", 2)  # force several statements
+        for i in range(3):
+            store.save(_record(game_hash=f"h{i}", feature="f"))
+        pairs = [("h0", "f"), ("h2", "f"), ("h1", "f"), ("h0", "f"), ("h9", "f")]
+        found = store.get_many(pairs)
+        assert set(found) == {("h0", "f"), ("h1", "f"), ("h2", "f")}
+        assert found[("h2", "f")].game_hash == "h2"
+        assert store.get_many([]) == {}
+
     def test_get_preserves_lua_script(self, store):
         lua = "writeFloat(0xDEAD, 9999.0)"
         store.save(_record(lua_script=lua))
@@ -143,6 +196,15 @@ class TestScriptStoreCounters:
         rec = store.get("hash1", "infinite_health")
         assert rec.fail_count == 1
 
+    def test_resave_updates_script_and_keeps_id_and_counters(self, store):
+        row_id = store.save(_record(lua_script="-- v1"))
+        store.record_success(row_id)
+        store.record_failure(row_id)
+        assert store.save(_record(lua_script="-- v2")) == row_id
+        rec = store.get("hash1", "infinite_health")
+        assert rec.lua_script == "-- v2"
+        assert (rec.success_count, rec.fail_count) == (1, 1)
+
     def test_counters_are_independent(self, store):
         row_id = store.save(_record())
         store.record_success(row_id)
@@ -171,6 +233,106 @@ class TestScriptStoreInvalidate:
         assert rec is not None
 
 
+class TestScriptStoreTimestamps:
+    """Timestamps are stored as Unix epoch seconds."""
+
+    _TEXT_SCHEMA = """
+        CREATE TABLE scripts (
+            id            INTEGER PRIMARY KEY AUTOINCREMENT,
+            game_hash     TEXT    NOT NULL,
+            game_name     TEXT    NOT NULL DEFAULT '',
+            engine_type   TEXT    NOT NULL DEFAULT '',
+            feature       TEXT    NOT NULL,
+            lua_script    TEXT    NOT NULL,
+            aob_sigs      TEXT    NOT NULL DEFAULT '[]',
+            created_at    TEXT    NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%SZ', 'now')),
+            last_used     TEXT,
+            success_count INTEGER NOT NULL DEFAULT 0,
+            fail_count    INTEGER NOT NULL DEFAULT 0,
+            UNIQUE(game_hash, feature)
+        );
+        CREATE INDEX idx_game_hash ON scripts(game_hash);
+    """
+
+    def test_round_trip_as_aware_utc(self, store):
+        created = datetime(2024, 5, 1, 12, 30, 15, tzinfo=UTC)
+        rec = _record()
+        rec.created_at = created
+        row_id = store.save(rec)
+        store.record_success(row_id)
+        rec = store.get("hash1", "infinite_health")
+        assert rec.created_at == created
+        assert rec.last_used.tzinfo is not None
+        (raw,) = store._conn.execute("SELECT created_at FROM scripts").fetchone()
+        assert raw == int(created.timestamp())
+
+    def test_text_timestamp_database_is_migrated(self, tmp_path):
+        from src.store.db import _FTS_SCHEMA_SQL, ScriptStore
+        db_path = tmp_path / "v0.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(self._TEXT_SCHEMA + _FTS_SCHEMA_SQL)
+        conn.execute(
+            "INSERT INTO scripts (game_hash, game_name, feature, lua_script, "
+            "created_at, last_used, success_count) VALUES "
+            "('h', 'Hollow Knight', 'f', '--', '2024-05-01T12:30:15Z', NULL, 3)"
+        )
+        conn.commit()
+        conn.close()
+
+        store = ScriptStore(str(db_path))
+        rec = store.get("h", "f")
+        assert rec.created_at == datetime(2024, 5, 1, 12, 30, 15, tzinfo=UTC)
+        assert rec.last_used is None and rec.success_count == 3
+        types = {r[1]: r[2] for r in store._conn.execute("PRAGMA table_info(scripts)")}
+        assert types["created_at"] == "INTEGER"
+        assert [r.id for r in store.search("hollow")] == [rec.id]
+        store.save(_record(game_hash="h2", game_name="Dark Souls", feature="f"))
+        assert len(store.search("dark")) == 1   # triggers recreated on the new table
+
+
+class TestScriptStoreConnection:
+    """One connection per store, shared safely across threads."""
+
+    def test_calls_reuse_one_connection(self, store, monkeypatch):
+        import src.store.db as db
+        def _no_connect(*args, **kwargs):
+            raise AssertionError("new connection opened")
+        monkeypatch.setattr(db.sqlite3, "connect", _no_connect)
+        row_id = store.save(_record())
+        store.record_success(row_id)
+        assert store.get("hash1", "infinite_health").success_count == 1
+
+    def test_failed_write_is_rolled_back(self, store):
+        store.save(_record())
+        with pytest.raises(RuntimeError):
+            with store._write() as conn:
+                conn.execute("DELETE FROM scripts")
+                raise RuntimeError("boom")
+        assert store.count() == 1
+
+    def test_concurrent_saves_from_threads(self, store):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: store.save(_record(game_hash=f"h{i}")), range(40)))
+        assert store.count() == 40
+
+    def test_close_via_context_manager(self, tmp_path):
+        from src.store.db import ScriptStore
+        with ScriptStore(str(tmp_path / "c.db")) as s:
+            s.save(_record())
+        with pytest.raises(sqlite3.ProgrammingError):
+            s.get("hash1", "infinite_health")
+
+    def test_in_memory_store(self, tmp_path, monkeypatch):
+        from src.store.db import ScriptStore
+        monkeypatch.chdir(tmp_path)
+        with ScriptStore(":memory:") as s:
+            s.save(_record())
+            assert s.get("hash1", "infinite_health") is not None
+            assert s.search("Game")
+        assert list(tmp_path.iterdir()) == []
+
+
 class TestScriptStoreSearch:
     """search() — query by game name substring."""
 
@@ -186,3 +348,49 @@ class TestScriptStoreSearch:
         store.save(_record(game_hash="h2", feature="f1", game_name="Other Game"))
         results = store.search(game_name="")
         assert len(results) >= 2
+
+    def test_listing_and_lookup_use_indexes(self, store):
+        def plan(sql, params=()):
+            return " ".join(r[3] for r in store._conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+        listing = plan("SELECT * FROM scripts ORDER BY created_at DESC, id DESC LIMIT 10")
+        assert "idx_created_at" in listing and "TEMP B-TREE" not in listing
+        lookup = plan("SELECT * FROM scripts WHERE game_hash=? AND feature=?", ("h", "f"))
+        assert "USING INDEX" in lookup
+
+    def test_search_windows_are_disjoint_and_counted(self, store):
+        for i in range(5):
+            store.save(_record(game_hash=f"h{i}", game_name=f"Game {i}", feature="f1"))
+        store.save(_record(game_hash="x", game_name="Other", feature="f1"))
+        first = store.search("game", limit=3, offset=0)
+        rest = store.search("game", limit=3, offset=3)
+        assert len(first) == 3 and len(rest) == 2
+        assert {r.id for r in first}.isdisjoint(r.id for r in rest)
+        assert store.count("game") == 5
+        assert store.count() == 6
+
+    def test_search_matches_word_prefixes_in_any_order(self, store):
+        store.save(_record(game_hash="h1", game_name="Hollow Knight", feature="f1"))
+        store.save(_record(game_hash="h2", game_name="Dark Souls", feature="f1"))
+        assert [r.game_name for r in store.search("kni holl")] == ["Hollow Knight"]
+        assert store.search('"unbalanced') == []
+
+    def test_search_index_follows_update_and_delete(self, store):
+        store.save(_record(game_name="Old Name", feature="f1"))
+        store.save(_record(game_name="New Name", feature="f1"))  # same key → update
+        assert store.search("old") == []
+        (rec,) = store.search("new")
+        store.delete(rec.id)
+        assert store.count("name") == 0
+
+    def test_existing_database_is_indexed_on_open(self, tmp_path):
+        from src.store.db import _SCHEMA_SQL, ScriptStore
+        db_path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(_SCHEMA_SQL)
+        conn.execute(
+            "INSERT INTO scripts (game_hash, game_name, feature, lua_script) "
+            "VALUES ('h', 'Hollow Knight', 'f', '--')"
+        )
+        conn.commit()
+        conn.close()
+        assert len(ScriptStore(str(db_path)).search("hollow")) == 1